@@ -4,6 +4,7 @@ Main Streamlit Application Entry Point
 """
 
 import streamlit as st
+import copy
 import os
 from dotenv import load_dotenv
 from datetime import datetime
@@ -38,6 +39,23 @@ LANGUAGE_MAP = {
     "ਪੰਜਾਬੀ (Punjabi)": "pa"
 }
 
+# Service worker registration script
+SERVICE_WORKER_SCRIPT = """
+    <script>
+    if ('serviceWorker' in navigator) {
+        window.addEventListener('load', () => {
+            navigator.serviceWorker.register('/static/service-worker.js')
+                .then(registration => {
+                    console.log('Service Worker registered:', registration);
+                })
+                .catch(error => {
+                    console.error('Service Worker registration failed:', error);
+                });
+        });
+    }
+    </script>
+    """
+
 # Agricultural theme CSS
 def inject_offline_support():
     """Inject offline support scripts and service worker"""
@@ -57,22 +75,7 @@ def inject_offline_support():
     st.components.v1.html(storage_manager.generate_storage_check_script(), height=0)
     
     # Register service worker
-    service_worker_script = """
-    <script>
-    if ('serviceWorker' in navigator) {
-        window.addEventListener('load', () => {
-            navigator.serviceWorker.register('/static/service-worker.js')
-                .then(registration => {
-                    console.log('Service Worker registered:', registration);
-                })
-                .catch(error => {
-                    console.error('Service Worker registration failed:', error);
-                });
-        });
-    }
-    </script>
-    """
-    st.components.v1.html(service_worker_script, height=0)
+    st.components.v1.html(SERVICE_WORKER_SCRIPT, height=0)
 
 
 def apply_custom_css():
@@ -215,34 +218,25 @@ def inject_chunk_error_recovery():
     st.components.v1.html(script, height=0)
 
 
+# Session state defaults, copied into each new session by initialize_session_state
+SESSION_DEFAULTS = {
+    "authenticated": False,
+    "user_id": None,
+    "user_name": None,
+    "phone_number": None,
+    "session_id": None,
+    "language": "en",
+    "chat_history": [],
+    "location": None,
+    "crops": [],
+}
+
+
 def initialize_session_state():
     """Initialize Streamlit session state variables"""
-    if "authenticated" not in st.session_state:
-        st.session_state.authenticated = False
-    
-    if "user_id" not in st.session_state:
-        st.session_state.user_id = None
-    
-    if "user_name" not in st.session_state:
-        st.session_state.user_name = None
-    
-    if "phone_number" not in st.session_state:
-        st.session_state.phone_number = None
-    
-    if "session_id" not in st.session_state:
-        st.session_state.session_id = None
-    
-    if "language" not in st.session_state:
-        st.session_state.language = "en"
-    
-    if "chat_history" not in st.session_state:
-        st.session_state.chat_history = []
-    
-    if "location" not in st.session_state:
-        st.session_state.location = None
-    
-    if "crops" not in st.session_state:
-        st.session_state.crops = []
+    for key, default in SESSION_DEFAULTS.items():
+        if key not in st.session_state:
+            st.session_state[key] = copy.deepcopy(default)
     
     if "orchestrator" not in st.session_state:
         try:
@@ -251,6 +245,14 @@ def initialize_session_state():
             st.session_state.orchestrator = None
             st.session_state.orchestrator_error = str(e)
 
+def add_message_to_history(role: str, content: str, timestamp: str = None):
+    """Append a chat message to the session's chat history"""
+    st.session_state.chat_history.append({
+        "role": role,
+        "content": content,
+        "timestamp": timestamp or datetime.now().strftime("%I:%M %p")
+    })
+
 def _set_session_from_user(user: dict):
     """Set session state from a user dict (after login or register)."""
     phone = user["phone"]
@@ -363,8 +365,7 @@ def render_authentication():
                         st.error("Please enter valid name and 10-digit phone number")
 
         st.markdown("</div>", unsafe_allow_html=True)
-        st.markdown("---")
-        st.markdown("### System Status")
+        st.markdown("---\n### System Status")
         health = get_orchestrator_health()
         if health.get("status") == "healthy":
             st.success("✅ All systems operational")
@@ -533,8 +534,7 @@ def render_chat_interface():
         return
     
     # Minimal header for other pages
-    st.markdown(f"# {page}")
-    st.markdown("---")
+    st.markdown(f"# {page}\n\n---")
     
     # Default location for UIs that need lat/lon (e.g. Delhi)
     user_location = getattr(st.session_state, "user_location", {"latitude": 28.6139, "longitude": 77.2090})
@@ -612,12 +612,14 @@ def render_chat_tab():
     chat_container = st.container()
     
     with chat_container:
-        # Display chat history
+        # Display chat history (timestamp folded into the message markdown
+        # so each message is a single element instead of markdown + caption)
         for message in st.session_state.chat_history:
             with st.chat_message(message["role"]):
-                st.markdown(message["content"])
+                body = message["content"]
                 if "timestamp" in message:
-                    st.caption(f"🕐 {message['timestamp']}")
+                    body = f"{body}\n\n:gray[🕐 {message['timestamp']}]"
+                st.markdown(body)
     
     # Chat input
     user_input = st.chat_input(
@@ -628,11 +630,7 @@ def render_chat_tab():
     if user_input:
         # Add user message to chat
         timestamp = datetime.now().strftime("%I:%M %p")
-        st.session_state.chat_history.append({
-            "role": "user",
-            "content": user_input,
-            "timestamp": timestamp
-        })
+        add_message_to_history("user", user_input, timestamp)
         
         # Get AI response
         try:
@@ -651,18 +649,10 @@ def render_chat_tab():
                     response_text = response["response"]
                     
                     # Add to chat history
-                    st.session_state.chat_history.append({
-                        "role": "assistant",
-                        "content": response_text,
-                        "timestamp": timestamp
-                    })
+                    add_message_to_history("assistant", response_text, timestamp)
                 else:
                     error_msg = response.get("error", "Unknown error occurred")
-                    st.session_state.chat_history.append({
-                        "role": "assistant",
-                        "content": f"⚠️ Error: {error_msg}",
-                        "timestamp": timestamp
-                    })
+                    add_message_to_history("assistant", f"⚠️ Error: {error_msg}", timestamp)
             else:
                 # Fallback response when orchestrator is not available
                 fallback_msg = """I apologize, but the AI assistant is currently unavailable. 
@@ -674,56 +664,35 @@ Please ensure:
 
 For now, I can provide general information, but advanced AI features require proper AWS setup."""
                 
-                st.session_state.chat_history.append({
-                    "role": "assistant",
-                    "content": fallback_msg,
-                    "timestamp": timestamp
-                })
+                add_message_to_history("assistant", fallback_msg, timestamp)
         
         except Exception as e:
             error_msg = f"An error occurred: {str(e)}"
-            st.session_state.chat_history.append({
-                "role": "assistant",
-                "content": f"⚠️ {error_msg}",
-                "timestamp": timestamp
-            })
+            add_message_to_history("assistant", f"⚠️ {error_msg}", timestamp)
         
         # Rerun to update chat display
         st.rerun()
     
     # Suggested questions
     if len(st.session_state.chat_history) == 0:
-        st.markdown("---")
-        st.markdown("### 💡 Suggested Questions")
+        st.markdown("---\n### 💡 Suggested Questions")
         
         col1, col2, col3 = st.columns(3)
         
         with col1:
             if st.button("🌿 How to identify crop diseases?", use_container_width=True):
-                st.session_state.chat_history.append({
-                    "role": "user",
-                    "content": "How can I identify diseases in my crops?",
-                    "timestamp": datetime.now().strftime("%I:%M %p")
-                })
+                add_message_to_history("user", "How can I identify diseases in my crops?")
                 st.rerun()
         
         with col2:
             if st.button("☁️ What's the weather forecast?", use_container_width=True):
-                st.session_state.chat_history.append({
-                    "role": "user",
-                    "content": f"What's the weather forecast for {st.session_state.location}?",
-                    "timestamp": datetime.now().strftime("%I:%M %p")
-                })
+                add_message_to_history("user", f"What's the weather forecast for {st.session_state.location}?")
                 st.rerun()
         
         with col3:
             if st.button("💰 Current market prices?", use_container_width=True):
                 crops_str = ", ".join(st.session_state.crops) if st.session_state.crops else "wheat and rice"
-                st.session_state.chat_history.append({
-                    "role": "user",
-                    "content": f"What are the current market prices for {crops_str}?",
-                    "timestamp": datetime.now().strftime("%I:%M %p")
-                })
+                add_message_to_history("user", f"What are the current market prices for {crops_str}?")
                 st.rerun()
 
 def render_disease_diagnosis_tab():
@@ -753,11 +722,7 @@ def render_disease_diagnosis_tab():
 You can ask me questions about this diagnosis or request more details about treatment.
 """
             
-            st.session_state.chat_history.append({
-                "role": "assistant",
-                "content": diagnosis_summary,
-                "timestamp": datetime.now().strftime("%I:%M %p")
-            })
+            add_message_to_history("assistant", diagnosis_summary)
     
     except ImportError as e:
         st.error(f"Disease identification module not available: {e}")
@@ -140,6 +140,40 @@ class OfflineStorageManager:
             });
         }
         
+        // Get the records whose index matches a value (e.g. pending actions)
+        function getOfflineDataByIndex(storeName, indexName, value) {
+            return new Promise((resolve, reject) => {
+                if (!riseDB) {
+                    reject(new Error('Database not initialized'));
+                    return;
+                }
+                
+                const transaction = riseDB.transaction([storeName], 'readonly');
+                const store = transaction.objectStore(storeName);
+                const request = store.index(indexName).getAll(value);
+                
+                request.onsuccess = () => resolve(request.result);
+                request.onerror = () => reject(request.error);
+            });
+        }
+        
+        // Count records without loading them, optionally by index value
+        function countOfflineData(storeName, indexName, value) {
+            return new Promise((resolve, reject) => {
+                if (!riseDB) {
+                    reject(new Error('Database not initialized'));
+                    return;
+                }
+                
+                const transaction = riseDB.transaction([storeName], 'readonly');
+                const store = transaction.objectStore(storeName);
+                const request = indexName ? store.index(indexName).count(value) : store.count();
+                
+                request.onsuccess = () => resolve(request.result);
+                request.onerror = () => reject(request.error);
+            });
+        }
+        
         // Delete data from IndexedDB
         function deleteOfflineData(storeName, key) {
             return new Promise((resolve, reject) => {
@@ -191,6 +225,10 @@ class OfflineStorageManager:
         
         // Clear expired cache every hour
         setInterval(clearExpiredCache, 60 * 60 * 1000);
+        
+        // Expose to Streamlit components
+        window.getAllOfflineData = getAllOfflineData;
+        window.countOfflineData = countOfflineData;
         </script>
         """
         
@@ -256,11 +294,20 @@ class OfflineStorageManager:
     def create_offline_action(self, action_type: str, action_data: Dict) -> Dict:
         """
         Create an offline action to be synced later
+        
+        Actions on the same entity (action_data["id"]) share an action_id,
+        so a later edit replaces the queued one instead of adding another
         """
         import uuid
         
+        entity_id = action_data.get("id")
+        if entity_id:
+            action_id = f"offline_{action_type}_{entity_id}"
+        else:
+            action_id = f"offline_{uuid.uuid4().hex[:12]}"
+        
         return {
-            "action_id": f"offline_{uuid.uuid4().hex[:12]}",
+            "action_id": action_id,
             "action_type": action_type,
             "action_data": action_data,
             "timestamp": int(time.time()),
@@ -310,11 +357,10 @@ class OfflineStorageManager:
                 
                 // Count items in stores
                 if (riseDB) {
-                    stats.diagnosis_count = (await getAllOfflineData('diagnosis_history')).length;
-                    stats.cached_weather_locations = (await getAllOfflineData('weather_cache')).length;
-                    stats.cached_market_prices = (await getAllOfflineData('market_prices')).length;
-                    stats.pending_sync_actions = (await getAllOfflineData('offline_queue'))
-                        .filter(a => a.sync_status === 'pending').length;
+                    stats.diagnosis_count = await countOfflineData('diagnosis_history');
+                    stats.cached_weather_locations = await countOfflineData('weather_cache');
+                    stats.cached_market_prices = await countOfflineData('market_prices');
+                    stats.pending_sync_actions = await countOfflineData('offline_queue', 'sync_status', 'pending');
                 }
             } catch (err) {
                 console.error('Error getting storage stats:', err);
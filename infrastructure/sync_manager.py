@@ -41,23 +41,54 @@ class SyncManager:
         let syncInProgress = false;
         let syncQueue = [];
         
+        // Exponential backoff after failed syncs (with jitter)
+        const SYNC_BACKOFF_BASE_MS = 1000;
+        const SYNC_BACKOFF_MAX_MS = 5 * 60 * 1000;
+        let syncBackoffMs = SYNC_BACKOFF_BASE_MS;
+        let nextSyncAt = 0;
+        
+        // Actions synced concurrently per batch
+        const SYNC_BATCH_SIZE = 10;
+        
+        // Pending actions kept while offline; beyond this the oldest
+        // lowest-priority action is dropped
+        const MAX_QUEUED_ACTIONS = 1000;
+        let droppedActionCount = 0;
+        
         // Check online status
         function isOnline() {
             return navigator.onLine;
         }
         
+        // Milliseconds until the next sync attempt is allowed
+        function getSyncRetryDelay() {
+            return Math.max(0, nextSyncAt - Date.now());
+        }
+        
+        // Record the outcome of a sync pass and schedule the next attempt
+        function updateSyncBackoff(hadFailures) {
+            if (!hadFailures) {
+                syncBackoffMs = SYNC_BACKOFF_BASE_MS;
+                nextSyncAt = 0;
+                return;
+            }
+            
+            syncBackoffMs = Math.min(syncBackoffMs * 2, SYNC_BACKOFF_MAX_MS);
+            nextSyncAt = Date.now() + syncBackoffMs * (0.5 + Math.random());
+        }
+        
         // Sync pending actions
         async function syncPendingActions() {
-            if (syncInProgress || !isOnline()) {
+            if (syncInProgress || !isOnline() || getSyncRetryDelay() > 0) {
                 return;
             }
             
             syncInProgress = true;
+            let hadFailures = false;
             
             try {
                 // Get all pending actions
-                const pendingActions = await getAllOfflineData('offline_queue');
-                const toSync = pendingActions.filter(a => a.sync_status === 'pending');
+                const toSync = await getOfflineDataByIndex('offline_queue', 'sync_status', 'pending');
                 
                 if (toSync.length === 0) {
                     syncInProgress = false;
@@ -75,31 +106,35 @@ class SyncManager:
                     return a.timestamp - b.timestamp;
                 });
                 
-                // Sync actions
-                for (const action of toSync) {
-                    try {
-                        await syncAction(action);
-                        
-                        // Mark as synced
-                        action.sync_status = 'synced';
-                        action.synced_at = Date.now();
-                        await storeOfflineData('offline_queue', action);
-                        
-                        // Notify success
-                        notifySyncProgress(toSync.length, toSync.indexOf(action) + 1);
-                        
-                    } catch (err) {
-                        console.error('Failed to sync action:', action.action_id, err);
-                        
-                        // Update retry count
-                        action.retry_count = (action.retry_count || 0) + 1;
+                // Sync actions in batches; requests within a batch run concurrently
+                for (let start = 0; start < toSync.length; start += SYNC_BATCH_SIZE) {
+                    const batch = toSync.slice(start, start + SYNC_BATCH_SIZE);
+                    const outcomes = await Promise.allSettled(batch.map(syncAction));
+                    
+                    for (let i = 0; i < batch.length; i++) {
+                        const action = batch[i];
                         
-                        if (action.retry_count >= 3) {
-                            action.sync_status = 'failed';
+                        if (outcomes[i].status === 'fulfilled') {
+                            // Mark as synced
+                            action.sync_status = 'synced';
+                            action.synced_at = Date.now();
+                        } else {
+                            console.error('Failed to sync action:', action.action_id, outcomes[i].reason);
+                            hadFailures = true;
+                            
+                            // Update retry count
+                            action.retry_count = (action.retry_count || 0) + 1;
+                            
+                            if (action.retry_count >= 3) {
+                                action.sync_status = 'failed';
+                            }
                         }
                         
                         await storeOfflineData('offline_queue', action);
                     }
+                    
+                    // Notify progress
+                    notifySyncProgress(toSync.length, start + batch.length);
                 }
                 
                 // Clean up synced actions older than 7 days
@@ -107,7 +142,9 @@ class SyncManager:
                 
             } catch (err) {
                 console.error('Sync process error:', err);
+                hadFailures = true;
             } finally {
+                updateSyncBackoff(hadFailures);
                 syncInProgress = false;
             }
         }
@@ -166,19 +203,54 @@ class SyncManager:
         // Clean up old synced actions
         async function cleanupSyncedActions() {
             const sevenDaysAgo = Date.now() - (7 * 24 * 60 * 60 * 1000);
-            const allActions = await getAllOfflineData('offline_queue');
+            const syncedActions = await getOfflineDataByIndex('offline_queue', 'sync_status', 'synced');
             
-            for (const action of allActions) {
-                if (action.sync_status === 'synced' && action.synced_at < sevenDaysAgo) {
+            for (const action of syncedActions) {
+                if (action.synced_at < sevenDaysAgo) {
                     await deleteOfflineData('offline_queue', action.action_id);
                 }
             }
         }
         
+        // Drop the oldest pending action of the lowest priority to make room
+        async function trimOfflineQueue() {
+            const pending = await getOfflineDataByIndex('offline_queue', 'sync_status', 'pending');
+            
+            if (pending.length < MAX_QUEUED_ACTIONS) {
+                return;
+            }
+            
+            let victim = pending[0];
+            for (const action of pending) {
+                const priority = getSyncPriority(action.action_type);
+                const victimPriority = getSyncPriority(victim.action_type);
+                
+                if (priority > victimPriority ||
+                    (priority === victimPriority && action.timestamp < victim.timestamp)) {
+                    victim = action;
+                }
+            }
+            
+            await deleteOfflineData('offline_queue', victim.action_id);
+            droppedActionCount++;
+            console.warn('Offline queue full, dropped action:', victim.action_id);
+        }
+        
         // Queue action for offline sync
         async function queueOfflineAction(actionType, actionData) {
+            // Repeated edits to the same entity share one queue entry, so the
+            // latest write replaces the earlier one instead of queueing again
+            const entityId = actionData && actionData.id;
+            const actionId = entityId
+                ? 'offline_' + actionType + '_' + entityId
+                : 'offline_' + Date.now() + '_' + Math.random().toString(36).substr(2, 9);
+            
+            if (!entityId || !(await getOfflineData('offline_queue', actionId))) {
+                await trimOfflineQueue();
+            }
+            
             const action = {
-                action_id: 'offline_' + Date.now() + '_' + Math.random().toString(36).substr(2, 9),
+                action_id: actionId,
                 action_type: actionType,
                 action_data: actionData,
                 timestamp: Date.now(),
@@ -200,6 +272,7 @@ class SyncManager:
         // Listen for online event
         window.addEventListener('online', () => {
             console.log('Connection restored, syncing pending actions...');
+            nextSyncAt = 0;
             setTimeout(syncPendingActions, 2000);
         });
         
@@ -213,6 +286,8 @@ class SyncManager:
         // Expose functions
         window.queueOfflineAction = queueOfflineAction;
         window.syncPendingActions = syncPendingActions;
+        window.getSyncRetryDelay = getSyncRetryDelay;
+        window.getDroppedActionCount = () => droppedActionCount;
         window.isOnline = isOnline;
         </script>
         """
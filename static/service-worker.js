@@ -46,7 +46,7 @@ self.addEventListener('activate', (event) => {
             .then((cacheNames) => {
                 return Promise.all(
                     cacheNames
-                        .filter((name) => name.startsWith('rise-') && name !== CACHE_VERSION)
+                        .filter((name) => name.startsWith('rise-') && !name.startsWith(`${CACHE_VERSION}-`))
                         .map((name) => caches.delete(name))
                 );
             })
@@ -64,15 +64,18 @@ self.addEventListener('fetch', (event) => {
         return;
     }
     
-    // Choose strategy based on request type
-    if (isStaticAsset(url)) {
+    // Choose strategy based on request type; page loads go to the network
+    // first so the app shell is never stale while online
+    if (request.mode === 'navigate') {
+        event.respondWith(networkFirst(request, DYNAMIC_CACHE));
+    } else if (isStaticAsset(url)) {
         event.respondWith(cacheFirst(request, STATIC_CACHE));
     } else if (isImage(url)) {
         event.respondWith(cacheFirst(request, IMAGE_CACHE));
     } else if (isAPIRequest(url)) {
         event.respondWith(networkFirst(request, API_CACHE));
     } else {
-        event.respondWith(staleWhileRevalidate(request, DYNAMIC_CACHE));
+        event.respondWith(staleWhileRevalidate(event, DYNAMIC_CACHE));
     }
 });
 
@@ -126,17 +129,16 @@ async function networkFirst(request, cacheName) {
 }
 
 // Stale-while-revalidate strategy (for dynamic content)
-async function staleWhileRevalidate(request, cacheName) {
+async function staleWhileRevalidate(event, cacheName) {
+    const { request } = event;
     const cachedResponse = await caches.match(request);
     
     const fetchPromise = fetch(request)
-        .then((networkResponse) => {
+        .then(async (networkResponse) => {
             if (networkResponse.ok) {
-                const cache = caches.open(cacheName);
-                cache.then((c) => {
-                    c.put(request, networkResponse.clone());
-                    limitCacheSize(cacheName);
-                });
+                const cache = await caches.open(cacheName);
+                await cache.put(request, networkResponse.clone());
+                await limitCacheSize(cacheName);
             }
             return networkResponse;
         })
@@ -145,6 +147,9 @@ async function staleWhileRevalidate(request, cacheName) {
             return cachedResponse || getOfflineFallback(request);
         });
     
+    // Keep the worker alive until the background refresh has been stored
+    event.waitUntil(fetchPromise);
+    
     return cachedResponse || fetchPromise;
 }
 
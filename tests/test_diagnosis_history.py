@@ -316,6 +316,20 @@ class TestDiagnosisHistoryTools:
         assert progress['status'] == 'worsening'
         assert progress['severity_change'] < 0  # Negative change = worsening
     
+    def test_compare_diagnosis_records(self, dynamodb_tables, sample_diagnoses):
+        """Test comparison of already-fetched records without refetching"""
+        tools = DiagnosisHistoryTools(region='us-east-1')
+        
+        history = tools.get_diagnosis_history(user_id='farmer_123')
+        records = [d for d in history if d['diagnosis_id'] in {'diag_001', 'diag_003'}]
+        
+        comparison = tools.compare_diagnosis_records(records)
+        
+        assert comparison['success'] is True
+        assert comparison['count'] == 2
+        assert comparison['diagnoses'][0]['created_timestamp'] <= comparison['diagnoses'][1]['created_timestamp']
+        assert tools.compare_diagnosis_records([])['success'] is False
+    
     def test_generate_report(self, dynamodb_tables, sample_diagnoses):
         """Test report generation"""
         tools = DiagnosisHistoryTools(region='us-east-1')
@@ -190,6 +190,31 @@ The crop appears healthy with no visible signs of disease.
         assert 'DISEASES DETECTED' in prompt
         assert 'TREATMENT RECOMMENDATIONS' in prompt
     
+    def test_s3_client_created_once_under_concurrency(self):
+        """Test concurrent first use creates a single shared S3 client"""
+        import threading
+        import time
+        from tools import disease_identification_tools as module
+        
+        def slow_client(*args, **kwargs):
+            time.sleep(0.01)
+            return Mock()
+        
+        with patch('boto3.client', side_effect=slow_client) as mock_client, \
+                patch.dict(module._s3_clients, clear=True):
+            clients = []
+            threads = [
+                threading.Thread(target=lambda: clients.append(module._get_s3_client('ap-south-1')))
+                for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        assert mock_client.call_count == 1
+        assert all(client is clients[0] for client in clients)
+    
     @patch('boto3.client')
     @patch('boto3.resource')
     def test_analyze_crop_image_success(self, mock_resource, mock_client, sample_image):
@@ -241,7 +266,7 @@ The crop appears healthy with no visible signs of disease.
             assert 'confidence_score' in result
             
             # Verify S3 upload was called
-            mock_s3.put_object.assert_called_once()
+            mock_s3.upload_fileobj.assert_called_once()
             
             # Verify DynamoDB storage was called
             mock_table.put_item.assert_called_once()
@@ -261,6 +286,21 @@ The crop appears healthy with no visible signs of disease.
         assert result['error'] == 'poor_image_quality'
         assert 'validation' in result
     
+    def test_analyze_crop_image_reuses_validation(self, disease_tools, sample_image):
+        """Test precomputed validation is not recomputed"""
+        validation = {'valid': False, 'issues': ['low_resolution'], 'guidance': []}
+        
+        with patch.object(disease_tools, 'validate_image_quality') as mock_validate:
+            result = disease_tools.analyze_crop_image(
+                image_data=sample_image,
+                user_id='test_user',
+                validation=validation
+            )
+        
+        mock_validate.assert_not_called()
+        assert result['error'] == 'poor_image_quality'
+        assert result['validation'] == validation
+    
     def test_extract_treatments(self, disease_tools):
         """Test treatment extraction from analysis"""
         analysis_text = """
@@ -146,9 +146,13 @@ class TestAWSServiceFailures(unittest.TestCase):
         """Test handling of missing AWS credentials"""
         mock_boto3.side_effect = NoCredentialsError()
         
+        from voice_tools import VoiceProcessingTools, _clear_aws_clients
+        
+        _clear_aws_clients()
+        self.addCleanup(_clear_aws_clients)
+        
         # This should be handled at the service initialization level
         with self.assertRaises(NoCredentialsError):
-            from voice_tools import VoiceProcessingTools
             VoiceProcessingTools()
 
 
@@ -182,8 +186,10 @@ class TestTimeoutScenarios(unittest.TestCase):
         
         mock_boto3.side_effect = mock_client_factory
         
-        from voice_tools import VoiceProcessingTools
+        from voice_tools import VoiceProcessingTools, _clear_aws_clients
         
+        _clear_aws_clients()
+        self.addCleanup(_clear_aws_clients)
         tools = VoiceProcessingTools()
         result = tools.transcribe_audio(
             audio_data=b'fake audio data',
@@ -505,8 +511,10 @@ class TestResourceCleanup(unittest.TestCase):
         mock_s3.delete_object.return_value = {}
         mock_boto3.return_value = mock_s3
         
-        from voice_tools import VoiceProcessingTools
+        from voice_tools import VoiceProcessingTools, _clear_aws_clients
         
+        _clear_aws_clients()
+        self.addCleanup(_clear_aws_clients)
         tools = VoiceProcessingTools()
         
         # Test cleanup method
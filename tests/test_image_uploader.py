@@ -14,7 +14,8 @@ from datetime import datetime
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from ui.image_uploader import ImageUploader, render_image_uploader, render_diagnosis_history
+from ui.image_uploader import ImageUploader, render_image_uploader, render_diagnosis_history, _load_upload, _image_hash
+from ui.image_uploader import _cached_history, _clear_history_caches
 
 
 class TestImageUploaderInitialization:
@@ -42,6 +43,17 @@ class TestImageUploaderInitialization:
         uploader = ImageUploader("farmer_123", "en")
         
         assert uploader.disease_tools is not None
+    
+    def test_disease_tools_created_lazily(self):
+        """Test disease tools are only created on first access"""
+        uploader = ImageUploader("farmer_123", "en")
+        assert uploader._disease_tools is None
+        
+        with patch('ui.image_uploader.get_disease_tools') as mock_factory:
+            tools = uploader.disease_tools
+            assert uploader.disease_tools is tools
+        
+        mock_factory.assert_called_once()
 
 
 class TestImageUpload:
@@ -136,6 +148,34 @@ class TestImagePreview:
             
             img_read = Image.open(img_buffer)
             assert img_read.format == fmt
+    
+    def test_load_upload_details(self):
+        """Test cached upload helper reads dimensions and format"""
+        img = Image.new('RGB', (320, 240))
+        img_buffer = io.BytesIO()
+        img.save(img_buffer, format='PNG')
+        
+        image_bytes = img_buffer.getvalue()
+        
+        upload = _load_upload(_image_hash(image_bytes), image_bytes)
+        
+        assert (upload['width'], upload['height'], upload['format']) == (320, 240, 'PNG')
+    
+    def test_preview_downscales_large_images(self):
+        """Test preview is shrunk for large uploads and untouched for small ones"""
+        large = io.BytesIO()
+        Image.new('RGB', (4000, 3000), color='green').save(large, format='JPEG')
+        large_bytes = large.getvalue()
+        small = io.BytesIO()
+        Image.new('RGB', (200, 150), color='green').save(small, format='JPEG')
+        small_bytes = small.getvalue()
+        
+        large_upload = _load_upload(_image_hash(large_bytes), large_bytes)
+        preview = Image.open(io.BytesIO(large_upload['preview']))
+        
+        assert max(preview.size) <= 1024
+        assert large_upload['width'] == 4000
+        assert _load_upload(_image_hash(small_bytes), small_bytes)['preview'] == small_bytes
 
 
 class TestAdditionalContext:
@@ -246,6 +286,117 @@ class TestImageAnalysis:
         assert timeout_occurred is True
 
 
+class TestImageValidationCache:
+    """Test image quality validation caching"""
+    
+    def test_validation_computed_once_per_image(self):
+        """Test repeated validation of the same image hits the cache"""
+        import streamlit as st
+        st.session_state.pop('_img_quality_cache', None)
+        
+        uploader = ImageUploader("farmer_123", "en")
+        uploader.disease_tools = Mock()
+        uploader.disease_tools.validate_image_quality.return_value = {'valid': True, 'issues': []}
+        
+        first = uploader._get_image_validation(b'same image')
+        second = uploader._get_image_validation(b'same image')
+        
+        assert first == second
+        uploader.disease_tools.validate_image_quality.assert_called_once_with(b'same image')
+    
+    def test_validation_recomputed_for_new_image(self):
+        """Test a different image is validated again"""
+        import streamlit as st
+        st.session_state.pop('_img_quality_cache', None)
+        
+        uploader = ImageUploader("farmer_123", "en")
+        uploader.disease_tools = Mock()
+        uploader.disease_tools.validate_image_quality.return_value = {'valid': True, 'issues': []}
+        
+        uploader._get_image_validation(b'image one')
+        uploader._get_image_validation(b'image two')
+        
+        assert uploader.disease_tools.validate_image_quality.call_count == 2
+
+
+class TestAnalysisCache:
+    """Test diagnosis result caching"""
+    
+    def _uploader(self, analysis_result):
+        import streamlit as st
+        st.session_state.pop('_analysis_cache', None)
+        st.session_state.pop('_analysis_future', None)
+        st.session_state.pop('_img_quality_cache', None)
+        
+        uploader = ImageUploader("farmer_123", "en")
+        uploader.disease_tools = Mock()
+        uploader.disease_tools.validate_image_quality.return_value = {'valid': True, 'issues': []}
+        uploader.disease_tools.analyze_crop_image.return_value = analysis_result
+        uploader._display_diagnosis = Mock()
+        return uploader
+    
+    def test_same_image_and_inputs_analyzed_once(self):
+        """Test repeated analysis of the same image reuses the diagnosis"""
+        uploader = self._uploader({'success': True, 'diagnosis_id': 'diag_123'})
+        
+        first = uploader._analyze_image(b'leaf image', 'wheat', None)
+        second = uploader._analyze_image(b'leaf image', 'wheat', None)
+        
+        assert first == second
+        uploader.disease_tools.analyze_crop_image.assert_called_once()
+        
+        uploader._analyze_image(b'leaf image', 'rice', None)
+        assert uploader.disease_tools.analyze_crop_image.call_count == 2
+    
+    def test_failed_analysis_not_cached(self):
+        """Test failed analyses are retried"""
+        uploader = self._uploader({'success': False, 'error': 'Service unavailable'})
+        
+        uploader._analyze_image(b'leaf image', None, None)
+        uploader._analyze_image(b'leaf image', None, None)
+        
+        assert uploader.disease_tools.analyze_crop_image.call_count == 2
+    
+    def test_poor_quality_image_skips_analysis(self):
+        """Test images failing validation never reach the vision model"""
+        uploader = self._uploader({'success': True, 'diagnosis_id': 'diag_123'})
+        uploader.disease_tools.validate_image_quality.return_value = {
+            'valid': False,
+            'issues': ['low_resolution'],
+            'guidance': ['Take a higher resolution photo (at least 300x300 pixels)']
+        }
+        uploader._display_quality_issues = Mock()
+        
+        assert uploader._analyze_image(b'tiny image', None, None) is None
+        
+        uploader.disease_tools.analyze_crop_image.assert_not_called()
+        uploader._display_quality_issues.assert_called_once()
+    
+    def test_pending_analysis_kept_until_done(self):
+        """Test a slow background analysis is polled on later runs"""
+        import threading
+        import streamlit as st
+        
+        release = threading.Event()
+        uploader = self._uploader(None)
+        
+        def slow_analysis(**kwargs):
+            release.wait(5)
+            return {'success': True, 'diagnosis_id': 'diag_456'}
+        
+        uploader.disease_tools.analyze_crop_image.side_effect = slow_analysis
+        
+        assert uploader._analyze_image(b'leaf image', None, None) is None
+        assert '_analysis_future' in st.session_state
+        
+        release.set()
+        result = uploader._poll_analysis()
+        
+        assert result['diagnosis_id'] == 'diag_456'
+        assert '_analysis_future' not in st.session_state
+        uploader.disease_tools.analyze_crop_image.assert_called_once()
+
+
 class TestDiagnosisDisplay:
     """Test diagnosis results display"""
     
@@ -373,6 +524,28 @@ class TestDiagnosisHistory:
         assert "No diagnoses" in message
 
 
+class TestHistoryCache:
+    """Test diagnosis history caching across reruns"""
+    
+    def test_history_fetched_once_until_cleared(self):
+        """Test repeated history reads reuse the cached result until cleared"""
+        _clear_history_caches()
+        history_tools = Mock()
+        history_tools.get_diagnosis_history.return_value = [{'diagnosis_id': 'diag_1'}]
+        filters_key = (('severity', 'high'),)
+        
+        first = _cached_history("farmer_cache_test", filters_key, history_tools)
+        second = _cached_history("farmer_cache_test", filters_key, history_tools)
+        
+        assert first == second == [{'diagnosis_id': 'diag_1'}]
+        history_tools.get_diagnosis_history.assert_called_once()
+        assert history_tools.get_diagnosis_history.call_args.kwargs['filters'] == {'severity': 'high'}
+        
+        _clear_history_caches()
+        _cached_history("farmer_cache_test", filters_key, history_tools)
+        assert history_tools.get_diagnosis_history.call_count == 2
+
+
 class TestStatisticsSummary:
     """Test statistics summary display"""
     
@@ -543,6 +716,23 @@ Analysis: {diagnosis['full_analysis']}
         assert 'MEDIUM' in report
         assert '89.0%' in report
     
+    def test_build_report(self):
+        """Test report text built from a diagnosis result"""
+        uploader = ImageUploader("farmer_123", "en")
+        
+        report = uploader._build_report({
+            'diagnosis_id': 'diag_123',
+            'severity': 'medium',
+            'confidence_score': 0.89,
+            'diseases': ['Leaf Blight', 'Rust']
+        })
+        
+        assert 'Diagnosis ID: diag_123' in report
+        assert 'User ID: farmer_123' in report
+        assert 'SEVERITY: MEDIUM' in report
+        assert '89.0%' in report
+        assert '- Leaf Blight\n- Rust' in report
+    
     def test_report_download(self):
         """Test report download filename"""
         diagnosis_id = 'diag_123'
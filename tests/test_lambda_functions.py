@@ -10,6 +10,7 @@ import boto3
 from unittest.mock import Mock, patch, MagicMock
 import sys
 import os
+import tempfile
 from datetime import datetime
 
 # Add tools directory to path for imports
@@ -18,6 +19,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'tools'))
 # Import Lambda functions
 from audio_upload_lambda import lambda_handler as audio_upload_handler
 from audio_upload_lambda import get_file_extension, create_response
+import voice_tools
 from voice_tools import VoiceProcessingTools, create_voice_tools
 from translation_tools import TranslationTools, create_translation_tools
 from image_analysis_lambda import lambda_handler as image_analysis_handler
@@ -200,6 +202,17 @@ class TestVoiceProcessingTools(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures"""
         self.voice_tools = VoiceProcessingTools(region='us-east-1')
+        # Drop the shared clients so tests that patch boto3.client get their mocks
+        voice_tools._clear_aws_clients()
+        self.addCleanup(voice_tools._clear_aws_clients)
+        # Keep synthesized speech from leaking between tests through the TTS cache
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        cache_patch = patch.object(voice_tools, 'TTS_CACHE_DIR', cache_dir.name)
+        cache_patch.start()
+        self.addCleanup(cache_patch.stop)
+        voice_tools._clear_tts_memory_cache()
+        self.addCleanup(voice_tools._clear_tts_memory_cache)
         self.test_text = "Hello, this is a test message"
         self.test_audio_data = b'fake audio data'
     
@@ -181,6 +181,20 @@ class TestMarketPriceTools:
         trends = market_tools._calculate_price_trends(stable_prices)
         assert trends['trend'] == 'stable'
     
+    def test_mock_history_generation(self, market_tools):
+        """Test mock history covers each day with plain Python values"""
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=9)
+        
+        history = market_tools._generate_mock_history(start_date, end_date)
+        
+        assert len(history) == 10
+        assert history[0]['date'] == start_date.isoformat()
+        assert history[-1]['date'] == end_date.isoformat()
+        assert all(isinstance(h['price'], float) for h in history)
+        assert all(isinstance(h['arrival_quantity'], int) for h in history)
+        assert all(80 <= h['arrival_quantity'] <= 200 for h in history)
+    
     def test_simple_price_prediction(self, market_tools):
         """Test simple moving average prediction"""
         history = [
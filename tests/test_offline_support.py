@@ -5,6 +5,9 @@ Tests for RISE Offline Support
 import pytest
 import sys
 import os
+import json
+import shutil
+import subprocess
 from datetime import datetime
 import time
 
@@ -20,6 +23,40 @@ from infrastructure.offline_config import (
     STORAGE_LIMITS
 )
 
+NODE = shutil.which("node")
+requires_node = pytest.mark.skipif(NODE is None, reason="node is needed to run the offline scripts")
+
+# Minimal browser globals for running the generated offline scripts in node
+BROWSER_STUBS = """
+const window = { addEventListener() {}, dispatchEvent() {} };
+const navigator = { onLine: true };
+const indexedDB = { open() { return {}; } };
+class CustomEvent { constructor(type, init) { this.detail = init && init.detail; } }
+setInterval = () => 0;
+"""
+
+# In-memory offline_queue standing in for the IndexedDB helpers
+QUEUE_STUBS = """
+const queue = new Map();
+async function getOfflineDataByIndex(store, index, value) {
+    return [...queue.values()].filter(a => a[index] === value).map(a => ({ ...a }));
+}
+async function getOfflineData(store, key) { return queue.get(key); }
+async function storeOfflineData(store, data) { queue.set(data.action_id, { ...data }); }
+async function deleteOfflineData(store, key) { queue.delete(key); }
+"""
+
+
+def run_offline_script(script_html, test_code, stubs=""):
+    """Run a generated <script> in node and return the JSON test_code prints last"""
+    body = script_html.split("<script>", 1)[1].rsplit("</script>", 1)[0]
+    program = (BROWSER_STUBS + stubs + body +
+               "\n(async () => {\n" + test_code + "\n})().then(() => process.exit(0), err => {"
+               " console.error(err); process.exit(1); });")
+    result = subprocess.run([NODE, "-e", program], capture_output=True, text=True, timeout=30)
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
 
 class TestOfflineStorageManager:
     """Test OfflineStorageManager functionality"""
@@ -96,6 +133,17 @@ class TestOfflineStorageManager:
         assert action["sync_status"] == "pending"
         assert action["retry_count"] == 0
         assert "timestamp" in action
+
+    def test_offline_actions_on_same_entity_share_id(self):
+        """Test that repeated edits to one entity coalesce in the queue"""
+        manager = get_storage_manager()
+
+        first = manager.create_offline_action("profile_update", {"id": "user_1", "name": "A"})
+        second = manager.create_offline_action("profile_update", {"id": "user_1", "name": "B"})
+        other = manager.create_offline_action("forum_post", {"content": "Test"})
+
+        assert first["action_id"] == second["action_id"] == "offline_profile_update_user_1"
+        assert other["action_id"] != first["action_id"]
     
     def test_generate_indexeddb_script(self):
         """Test IndexedDB initialization script generation"""
@@ -109,6 +157,46 @@ class TestOfflineStorageManager:
         assert "diagnosis_history" in script
         assert "weather_cache" in script
     
+    @requires_node
+    def test_queue_lookups_use_status_index(self):
+        """Test queue reads and counts go through the sync_status index"""
+        manager = get_storage_manager()
+        
+        result = run_offline_script(manager.generate_indexeddb_init_script(), """
+            const records = [
+                { action_id: 'a', sync_status: 'pending' },
+                { action_id: 'b', sync_status: 'synced' },
+                { action_id: 'c', sync_status: 'pending' }
+            ];
+            const indexes = [];
+            const request = (result) => {
+                const req = {};
+                setTimeout(() => { req.result = result; req.onsuccess(); });
+                return req;
+            };
+            const store = {
+                index(name) {
+                    indexes.push(name);
+                    return {
+                        getAll: (value) => request(records.filter(r => r[name] === value)),
+                        count: (value) => request(records.filter(r => r[name] === value).length)
+                    };
+                },
+                count: () => request(records.length)
+            };
+            riseDB = { transaction: () => ({ objectStore: () => store }) };
+            
+            const pending = await getOfflineDataByIndex('offline_queue', 'sync_status', 'pending');
+            const pendingCount = await countOfflineData('offline_queue', 'sync_status', 'pending');
+            const total = await countOfflineData('offline_queue');
+            console.log(JSON.stringify({ pending: pending.map(r => r.action_id), pendingCount, total, indexes }));
+        """)
+        
+        assert result["pending"] == ["a", "c"]
+        assert result["pendingCount"] == 2
+        assert result["total"] == 3
+        assert result["indexes"] == ["sync_status", "sync_status"]
+    
     def test_generate_storage_check_script(self):
         """Test storage check script generation"""
         manager = get_storage_manager()
@@ -152,6 +240,37 @@ class TestSyncManager:
         assert "queueOfflineAction" in script
         assert "navigator.onLine" in script
     
+    @requires_node
+    def test_sync_backs_off_after_failures(self):
+        """Test failed syncs double the retry delay and a clean sync resets it"""
+        manager = get_sync_manager()
+        
+        result = run_offline_script(manager.generate_sync_script(), """
+            Math.random = () => 0.5;
+            let fetches = 0;
+            global.fetch = async () => { fetches++; return { ok: false, status: 503 }; };
+            queue.set('a', { action_id: 'a', action_type: 'analytics', action_data: {}, timestamp: 1, sync_status: 'pending' });
+            
+            await syncPendingActions();
+            const firstDelay = getSyncRetryDelay();
+            await syncPendingActions();
+            const fetchesDuringBackoff = fetches;
+            
+            nextSyncAt = 0;
+            await syncPendingActions();
+            const secondDelay = getSyncRetryDelay();
+            
+            global.fetch = async () => ({ ok: true, json: async () => ({}) });
+            nextSyncAt = 0;
+            await syncPendingActions();
+            console.log(JSON.stringify({ firstDelay, fetchesDuringBackoff, secondDelay, finalDelay: getSyncRetryDelay() }));
+        """, stubs=QUEUE_STUBS)
+        
+        assert 1900 < result["firstDelay"] <= 2000
+        assert result["fetchesDuringBackoff"] == 1
+        assert 3900 < result["secondDelay"] <= 4000
+        assert result["finalDelay"] == 0
+    
     def test_get_sync_status(self):
         """Test getting sync status"""
         manager = get_sync_manager()
@@ -176,6 +295,39 @@ class TestSyncManager:
         assert result["success"] is False
         assert "error" in result
 
+    @requires_node
+    def test_sync_posts_each_action_to_its_endpoint(self):
+        """Test a batch is posted concurrently and only failed actions are retried"""
+        manager = get_sync_manager()
+        
+        result = run_offline_script(manager.generate_sync_script(), """
+            const posted = [];
+            let inFlight = 0, maxInFlight = 0;
+            global.fetch = async (url) => {
+                posted.push(url);
+                maxInFlight = Math.max(maxInFlight, ++inFlight);
+                await null;
+                inFlight--;
+                return { ok: url !== '/api/v1/analytics/event', status: 500, json: async () => ({}) };
+            };
+            for (const [type, ts] of [['analytics', 1], ['forum_post', 2], ['chat_message', 3]]) {
+                queue.set(type, { action_id: type, action_type: type, action_data: {}, timestamp: ts, sync_status: 'pending' });
+            }
+            await syncPendingActions();
+            console.log(JSON.stringify({ posted, maxInFlight, queue: Object.fromEntries(queue) }));
+        """, stubs=QUEUE_STUBS)
+        
+        assert result["posted"] == [
+            "/api/v1/community/discussions",
+            "/api/v1/chat/message",
+            "/api/v1/analytics/event"
+        ]
+        assert result["maxInFlight"] == 3
+        assert result["queue"]["forum_post"]["sync_status"] == "synced"
+        assert result["queue"]["chat_message"]["sync_status"] == "synced"
+        assert result["queue"]["analytics"]["sync_status"] == "pending"
+        assert result["queue"]["analytics"]["retry_count"] == 1
+
 
 class TestOfflineConfig:
     """Test offline configuration"""
@@ -253,6 +405,24 @@ class TestOfflineIndicator:
         from ui.offline_indicator import render_storage_stats
         assert callable(render_storage_stats)
 
+    def test_offline_indicator_html_built_once_per_language(self):
+        """Test that the indicator markup is reused for the same language"""
+        from ui.offline_indicator import _offline_indicator_html
+
+        html = _offline_indicator_html("hi")
+        assert _offline_indicator_html("hi") is html
+        assert "const currentLang = 'hi';" in html
+        assert _offline_indicator_html("en") is not html
+
+    def test_offline_features_markdown(self):
+        """Test that enabled offline features render as one markdown block"""
+        from ui.offline_indicator import _offline_features_markdown
+
+        markdown = _offline_features_markdown("en")
+        assert markdown.startswith("**These features are available")
+        assert "✅ View past crop diagnoses" in markdown
+        assert _offline_features_markdown("xx") == markdown
+
 
 class TestServiceWorker:
     """Test service worker file"""
@@ -282,6 +452,7 @@ class TestServiceWorker:
         assert "addEventListener('fetch'" in content
         assert "cacheFirst" in content
         assert "networkFirst" in content
+        assert "request.mode === 'navigate'" in content
 
 
 class TestOfflinePage:
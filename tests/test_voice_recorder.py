@@ -19,6 +19,16 @@ from ui.voice_recorder import (
 )
 
 
+def _read_frontend_file(name):
+    """Read a file from the recorder component's static frontend"""
+    path = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        'ui', 'voice_recorder_frontend', name
+    )
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
 class TestVoiceRecorderRendering:
     """Test voice recorder component rendering"""
     
@@ -192,6 +202,18 @@ class TestAudioPlayback:
         for control in controls:
             assert isinstance(control, str)
             assert len(control) > 0
+    
+    @patch('streamlit.audio')
+    @patch('streamlit.markdown')
+    def test_audio_player_uses_media_endpoint(self, mock_markdown, mock_audio):
+        """Test playback sends raw bytes through st.audio instead of inline base64"""
+        render_audio_player(b'fake audio', key='player')
+        
+        mock_audio.assert_called_once_with(b'fake audio', format='audio/wav')
+        mock_markdown.assert_not_called()
+        
+        render_audio_player(b'\x1a\x45\xdf\xa3opus', key='player')
+        assert mock_audio.call_args.kwargs['format'] == 'audio/webm'
 
 
 class TestWaveformVisualization:
@@ -234,6 +256,24 @@ class TestWaveformVisualization:
             bar['height'] = '10px'
         
         assert all(bar['height'] == '10px' for bar in bars)
+    
+    def test_waveform_animates_with_transforms(self):
+        """Test waveform bars scale from precomputed levels on animation frames"""
+        html = _read_frontend_file('index.html')
+        script = _read_frontend_file('main.js')
+        
+        assert 'new Uint8Array(WAVEFORM_SAMPLES)' in script
+        assert 'requestAnimationFrame(animateWaveform)' in script
+        assert 'will-change: transform;' in html
+        assert 'Math.random' not in script
+    
+    def test_recording_stops_after_trailing_silence(self):
+        """Test recorder taps the microphone level to stop when speech ends"""
+        script = _read_frontend_file('main.js')
+        
+        assert 'analyser.getByteTimeDomainData(levelBuffer)' in script
+        assert 'heardSpeech && ++silentTicks >= SILENCE_TICKS' in script
+        assert 'audioContext.close()' in script
 
 
 class TestMicrophoneAccess:
@@ -322,6 +362,55 @@ class TestTranscriptionIntegration:
         assert result['success'] is False
         assert 'error' in result
     
+    @patch('tools.voice_tools.VoiceProcessingTools')
+    def test_voice_tools_shared_across_calls(self, mock_voice_tools):
+        """Test voice tools are constructed once and then reused"""
+        from ui.voice_recorder import get_voice_tools
+        
+        get_voice_tools.clear()
+        try:
+            assert get_voice_tools() is get_voice_tools()
+            mock_voice_tools.assert_called_once()
+        finally:
+            get_voice_tools.clear()
+    
+    def test_same_recording_transcribed_once(self):
+        """Test repeated transcription of a recording reuses the result"""
+        import streamlit as st
+        from ui.voice_recorder import _transcribe_recording
+        
+        st.session_state.pop('_transcription_cache', None)
+        voice_tools = Mock()
+        voice_tools.process_voice_query.return_value = {
+            'success': True,
+            'text': 'What is the weather today?',
+            'language_name': 'English',
+            'confidence': 0.95
+        }
+        
+        first = _transcribe_recording(voice_tools, b'fake audio', 'en')
+        second = _transcribe_recording(voice_tools, b'fake audio', 'en')
+        
+        assert first == second
+        voice_tools.process_voice_query.assert_called_once()
+        
+        _transcribe_recording(voice_tools, b'other audio', 'en')
+        assert voice_tools.process_voice_query.call_count == 2
+    
+    def test_failed_transcription_not_cached(self):
+        """Test failed transcriptions are retried"""
+        import streamlit as st
+        from ui.voice_recorder import _transcribe_recording
+        
+        st.session_state.pop('_transcription_cache', None)
+        voice_tools = Mock()
+        voice_tools.process_voice_query.return_value = {'success': False, 'error': 'Timeout'}
+        
+        _transcribe_recording(voice_tools, b'fake audio', 'en')
+        _transcribe_recording(voice_tools, b'fake audio', 'en')
+        
+        assert voice_tools.process_voice_query.call_count == 2
+    
     def test_transcription_confidence_threshold(self):
         """Test transcription confidence threshold"""
         confidence_threshold = 0.7
@@ -541,6 +630,30 @@ class TestPerformance:
         
         assert len(audio_chunks) == 0
 
+    @patch('ui.voice_recorder._recorder_component')
+    def test_recorder_sends_only_args_per_rerun(self, mock_component):
+        """Test the recorder passes labels and limits to the static component"""
+        mock_component.return_value = None
+        
+        assert render_voice_recorder(key='rec', language='hi', max_duration=30, show_waveform=False) is None
+        
+        kwargs = mock_component.call_args.kwargs
+        assert kwargs['labels']['max_duration'] == 'अधिकतम 30s'
+        assert kwargs['max_duration'] == 30
+        assert kwargs['show_waveform'] is False
+        assert kwargs['key'] == 'rec'
+    
+    @patch('ui.voice_recorder._recorder_component')
+    def test_recorder_returns_recorded_audio(self, mock_component):
+        """Test the component value is decoded back to audio bytes"""
+        mock_component.return_value = {
+            'audio_data': base64.b64encode(b'fake audio').decode('utf-8'),
+            'duration': 3,
+            'format': 'audio/wav'
+        }
+        
+        assert render_voice_recorder(key='rec') == b'fake audio'
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -169,6 +169,52 @@ class TestVoiceProcessingTools:
         assert result['success'] == False
         assert 'error' in result
     
+    def test_transcribe_audio_polls_quickly_then_backs_off(self, voice_tools):
+        """Test transcription job polling starts short and backs off"""
+        from unittest.mock import Mock, patch
+        
+        in_progress = {'TranscriptionJob': {'TranscriptionJobStatus': 'IN_PROGRESS'}}
+        completed = {'TranscriptionJob': {
+            'TranscriptionJobStatus': 'COMPLETED',
+            'Transcript': {'TranscriptFileUri': 'https://example.com/t.json'}
+        }}
+        voice_tools.s3_client = Mock()
+        voice_tools.transcribe_client = Mock()
+        voice_tools.transcribe_client.get_transcription_job.side_effect = [
+            in_progress, in_progress, in_progress, in_progress, completed
+        ]
+        transcript = Mock()
+        transcript.json.return_value = {'results': {
+            'transcripts': [{'transcript': 'When to sow wheat?'}], 'items': []
+        }}
+        
+        with patch('tools.voice_tools.time.sleep') as sleep, \
+                patch('requests.get', return_value=transcript):
+            result = voice_tools.transcribe_audio(b'RIFF', language_code='en')
+        
+        assert result['success'] is True
+        assert result['text'] == 'When to sow wheat?'
+        assert [c.args[0] for c in sleep.call_args_list] == [0.5, 1.0, 2.0, 2.0]
+        voice_tools.s3_client.upload_fileobj.assert_called_once()
+    
+    def test_transcribe_audio_detects_browser_recording_format(self, voice_tools):
+        """Test WebM/Opus recordings are uploaded and transcribed as webm"""
+        from unittest.mock import Mock
+        
+        voice_tools.s3_client = Mock()
+        voice_tools.transcribe_client = Mock()
+        voice_tools.transcribe_client.get_transcription_job.return_value = {
+            'TranscriptionJob': {'TranscriptionJobStatus': 'FAILED', 'FailureReason': 'test'}
+        }
+        
+        voice_tools.transcribe_audio(b'\x1a\x45\xdf\xa3opus', language_code='hi')
+        
+        upload = voice_tools.s3_client.upload_fileobj.call_args
+        assert upload.args[2].endswith('.webm')
+        assert upload.kwargs['ExtraArgs'] == {'ContentType': 'audio/webm'}
+        job = voice_tools.transcribe_client.start_transcription_job.call_args.kwargs
+        assert job['MediaFormat'] == 'webm'
+    
     def test_process_voice_query_structure(self, voice_tools):
         """Test voice query processing response structure"""
         # Use minimal audio data for structure test
@@ -199,6 +245,112 @@ class TestVoiceProcessingTools:
         except Exception as e:
             pytest.skip(f"AWS Polly not available: {e}")
     
+    def test_synthesize_speech_cached_by_content(self, tmp_path):
+        """Test identical utterances are served from the speech cache"""
+        import io
+        from unittest.mock import Mock
+        from tools import voice_tools as voice_tools_module
+        
+        voice_tools_module._clear_tts_memory_cache()
+        tools = VoiceProcessingTools(region="us-east-1", tts_cache_dir=str(tmp_path))
+        tools.polly_client = Mock()
+        tools.polly_client.synthesize_speech.side_effect = lambda **kwargs: {'AudioStream': io.BytesIO(b'mp3 bytes')}
+        
+        first = tools.synthesize_speech("Water the wheat today", language_code="en")
+        second = tools.synthesize_speech("Water the wheat today", language_code="en")
+        
+        assert first['cached'] is False
+        assert second['cached'] is True
+        assert second['audio_data'] == first['audio_data']
+        assert tools.polly_client.synthesize_speech.call_count == 1
+        
+        # A fresh process (empty memory cache) still hits the disk copy
+        voice_tools_module._clear_tts_memory_cache()
+        other = VoiceProcessingTools(region="us-east-1", tts_cache_dir=str(tmp_path))
+        other.polly_client = Mock()
+        assert other.synthesize_speech("Water the wheat today", language_code="en")['cached'] is True
+        other.polly_client.synthesize_speech.assert_not_called()
+        
+        tools.synthesize_speech("Water the wheat today", language_code="hi")
+        assert tools.polly_client.synthesize_speech.call_count == 2
+    
+    def test_speech_memory_cache_bounded_by_size(self, tmp_path, monkeypatch):
+        """Test the in-memory speech cache evicts oldest audio past its byte cap"""
+        from tools import voice_tools as voice_tools_module
+        
+        voice_tools_module._clear_tts_memory_cache()
+        monkeypatch.setattr(voice_tools_module, '_TTS_MEMORY_CACHE_MAX_BYTES', 10)
+        tools = VoiceProcessingTools(region="us-east-1", tts_cache_dir=str(tmp_path))
+        
+        tools._remember_speech('a', b'12345')
+        tools._remember_speech('b', b'12345')
+        tools._remember_speech('c', b'12345')
+        
+        assert list(voice_tools_module._tts_memory_cache) == ['b', 'c']
+        assert voice_tools_module._tts_memory_bytes == 10
+        voice_tools_module._clear_tts_memory_cache()
+    
+    def test_speech_disk_cache_evicts_oldest_files(self, tmp_path, monkeypatch):
+        """Test the on-disk speech cache prunes least recently used files"""
+        import os
+        from tools import voice_tools as voice_tools_module
+        
+        monkeypatch.setattr(voice_tools_module, '_TTS_DISK_CACHE_MAX_FILES', 2)
+        tools = VoiceProcessingTools(region="us-east-1", tts_cache_dir=str(tmp_path))
+        
+        tools._save_speech_to_cache('a', 'mp3', b'aaa')
+        os.utime(tmp_path / 'a.mp3', (100, 100))
+        tools._save_speech_to_cache('b', 'mp3', b'bbb')
+        os.utime(tmp_path / 'b.mp3', (200, 200))
+        
+        # Reading 'a' back from disk marks it as recently used
+        voice_tools_module._clear_tts_memory_cache()
+        assert tools._get_cached_speech('a', 'mp3') == b'aaa'
+        tools._save_speech_to_cache('c', 'mp3', b'ccc')
+        
+        assert sorted(os.listdir(tmp_path)) == ['a.mp3', 'c.mp3']
+        
+        monkeypatch.setattr(voice_tools_module, '_TTS_DISK_CACHE_MAX_BYTES', 4)
+        tools._save_speech_to_cache('d', 'mp3', b'dddd')
+        
+        assert os.listdir(tmp_path) == ['d.mp3']
+        voice_tools_module._clear_tts_memory_cache()
+    
+    def test_aws_clients_shared_across_instances(self, voice_tools):
+        """Test that tool instances reuse the same AWS clients"""
+        other = VoiceProcessingTools(region="us-east-1")
+        
+        assert other.s3_client is voice_tools.s3_client
+        assert other.polly_client is voice_tools.polly_client
+        assert other.transcribe_client is voice_tools.transcribe_client
+    
+    def test_aws_client_created_once_under_concurrency(self):
+        """Test concurrent first use creates a single shared client"""
+        import threading
+        import time
+        from unittest.mock import Mock, patch
+        from tools import voice_tools as voice_tools_module
+        
+        def slow_client(*args, **kwargs):
+            time.sleep(0.01)
+            return Mock()
+        
+        with patch('tools.voice_tools.boto3.client', side_effect=slow_client) as mock_client, \
+                patch.dict(voice_tools_module._aws_clients, clear=True):
+            clients = []
+            threads = [
+                threading.Thread(target=lambda: clients.append(
+                    voice_tools_module._get_aws_client('polly', 'ap-south-1')))
+                for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        assert mock_client.call_count == 1
+        assert all(client is clients[0] for client in clients)
+    
     def test_create_voice_tools_factory(self):
         """Test factory function"""
         tools = create_voice_tools(region="us-west-2")
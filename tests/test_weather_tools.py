@@ -13,12 +13,19 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from tools.weather_tools import WeatherTools, create_weather_tools
+from tools.weather_tools import WeatherTools, create_weather_tools, _FORECAST_MEMO
 
 
 class TestWeatherTools:
     """Test suite for WeatherTools"""
     
+    @pytest.fixture(autouse=True)
+    def clear_forecast_memo(self):
+        """Start each test with an empty in-process forecast memo"""
+        _FORECAST_MEMO.clear()
+        yield
+        _FORECAST_MEMO.clear()
+    
     @pytest.fixture
     def mock_dynamodb(self):
         """Mock DynamoDB resource"""
@@ -157,6 +164,25 @@ class TestWeatherTools:
         assert result['daily_summary'][0]['temp_max'] == 32.0
         assert result['daily_summary'][0]['rain_total'] == 0.0
     
+    def test_get_forecast_memoized_within_hour(self, weather_tools, mock_requests,
+                                               sample_forecast_response, mock_dynamodb):
+        """Test repeated forecasts skip DynamoDB and the API within the hour"""
+        mock_dynamodb.get_item.return_value = {}
+        mock_response = Mock()
+        mock_response.json.return_value = sample_forecast_response
+        mock_response.raise_for_status = Mock()
+        mock_requests.get.return_value = mock_response
+        
+        first = weather_tools.get_forecast(28.6139, 77.2090, days=5)
+        first['daily_summary'].clear()  # caller mutation must not leak into the memo
+        second = weather_tools.get_forecast(28.6139, 77.2090, days=5)
+        
+        assert first['from_cache'] is False
+        assert second['from_cache'] is True
+        assert len(second['daily_summary']) == 5
+        mock_requests.get.assert_called_once()
+        mock_dynamodb.get_item.assert_called_once()
+    
     def test_get_forecast_from_cache(self, weather_tools, mock_dynamodb):
         """Test forecast retrieval from cache"""
         # Mock cache hit
@@ -283,6 +309,25 @@ class TestWeatherTools:
         assert 'plan_for_tomorrow' in activities
         assert len(activities['recommended_today']) > 0
     
+    def test_suggest_optimal_activities_windy_rain(self, weather_tools):
+        """Test spraying is avoided in wind and rain"""
+        current = {
+            'temperature': 38,
+            'humidity': 85,
+            'wind_speed': 20,
+            'rain_1h': 3,
+            'rain_3h': 0
+        }
+        
+        activities = weather_tools._suggest_optimal_activities(current, [])
+        
+        assert activities['recommended_today'] == ["Transplanting seedlings"]
+        assert activities['avoid_today'] == [
+            "Spraying operations",
+            "Heavy manual labor during midday"
+        ]
+        assert activities['plan_for_tomorrow'] == []
+    
     def test_cache_key_generation(self, weather_tools):
         """Test cache key generation"""
         key1 = weather_tools._get_cache_key(28.6139, 77.2090, 'current')
@@ -35,7 +35,8 @@ class DiagnosisHistoryTools:
     def get_diagnosis_history(self,
                              user_id: str,
                              limit: int = 20,
-                             filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+                             filters: Optional[Dict[str, Any]] = None,
+                             projection: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         Get diagnosis history for a user with optional filtering
         
@@ -43,27 +44,34 @@ class DiagnosisHistoryTools:
             user_id: User ID
             limit: Maximum number of records
             filters: Optional filters
+            projection: Optional attribute names to fetch (default: all)
         
         Returns:
             List of diagnosis records
         """
         try:
+            query_args = {
+                'KeyConditionExpression': 'user_id = :uid',
+                'ExpressionAttributeValues': {':uid': user_id},
+                'ScanIndexForward': False,
+                'Limit': limit
+            }
+            if projection:
+                # Placeholders keep attribute names clear of DynamoDB reserved words
+                names = {f'#p{i}': attr for i, attr in enumerate(projection)}
+                query_args['ProjectionExpression'] = ', '.join(names)
+                query_args['ExpressionAttributeNames'] = names
+            
             # Query disease diagnoses
             disease_response = self.diagnosis_table.query(
                 IndexName='UserDiagnosisIndex',
-                KeyConditionExpression='user_id = :uid',
-                ExpressionAttributeValues={':uid': user_id},
-                ScanIndexForward=False,
-                Limit=limit
+                **query_args
             )
             
             # Query pest diagnoses
             pest_response = self.pest_diagnosis_table.query(
                 IndexName='UserPestDiagnosisIndex',
-                KeyConditionExpression='user_id = :uid',
-                ExpressionAttributeValues={':uid': user_id},
-                ScanIndexForward=False,
-                Limit=limit
+                **query_args
             )
             
             # Combine results
@@ -218,24 +226,7 @@ class DiagnosisHistoryTools:
                         diag['diagnosis_type'] = 'pest'
                         diagnoses.append(diag)
             
-            if not diagnoses:
-                return {
-                    'success': False,
-                    'error': 'No diagnoses found'
-                }
-            
-            # Sort by timestamp
-            diagnoses.sort(key=lambda x: x.get('created_timestamp', 0))
-            
-            # Calculate progress
-            progress = self._calculate_progress(diagnoses)
-            
-            return {
-                'success': True,
-                'diagnoses': diagnoses,
-                'progress': progress,
-                'count': len(diagnoses)
-            }
+            return self.compare_diagnosis_records(diagnoses)
         
         except Exception as e:
             logger.error(f"Error comparing diagnoses: {e}", exc_info=True)
@@ -244,6 +235,35 @@ class DiagnosisHistoryTools:
                 'error': str(e)
             }
     
+    def compare_diagnosis_records(self, diagnoses: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Compare already-fetched diagnosis records for treatment progress tracking
+        
+        Args:
+            diagnoses: Diagnosis records (e.g. from get_diagnosis_history)
+        
+        Returns:
+            Comparison data
+        """
+        if not diagnoses:
+            return {
+                'success': False,
+                'error': 'No diagnoses found'
+            }
+        
+        # Sort by timestamp
+        diagnoses = sorted(diagnoses, key=lambda x: x.get('created_timestamp', 0))
+        
+        # Calculate progress
+        progress = self._calculate_progress(diagnoses)
+        
+        return {
+            'success': True,
+            'diagnoses': diagnoses,
+            'progress': progress,
+            'count': len(diagnoses)
+        }
+    
     def _calculate_progress(self, diagnoses: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Calculate treatment progress metrics"""
         if len(diagnoses) < 2:
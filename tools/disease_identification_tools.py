@@ -7,12 +7,15 @@ import boto3
 import logging
 import base64
 import json
+import threading
 import uuid
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 from PIL import Image
 import io
 
+from boto3.s3.transfer import TransferConfig
+
 try:
     from botocore.exceptions import ClientError
 except ImportError:
@@ -20,6 +23,29 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Multipart tuning for image uploads (parts stream in parallel above 5MB)
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=5 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True
+)
+
+# S3 clients shared across tool instances, keyed by region. Creation is
+# serialized: sessions and analysis workers can ask for a client at the same
+# time, and boto3's default session is not safe for concurrent client creation
+_s3_clients: Dict[str, Any] = {}
+_s3_clients_lock = threading.Lock()
+
+
+def _get_s3_client(region: str):
+    """Get shared S3 client for a region (created on first use)"""
+    with _s3_clients_lock:
+        client = _s3_clients.get(region)
+        if client is None:
+            client = boto3.client('s3', region_name=region)
+            _s3_clients[region] = client
+        return client
+
 
 class DiseaseIdentificationTools:
     """Crop disease identification tools using Amazon Bedrock multimodal"""
@@ -36,7 +62,7 @@ class DiseaseIdentificationTools:
         
         self.region = region
         self.bedrock_runtime = boto3.client('bedrock-runtime', region_name=region)
-        self.s3_client = boto3.client('s3', region_name=region)
+        self.s3_client = _get_s3_client(region)
         self.dynamodb = boto3.resource('dynamodb', region_name=region)
         
         # DynamoDB table for diagnosis history
@@ -67,29 +93,37 @@ class DiseaseIdentificationTools:
         """
         try:
             img = Image.open(io.BytesIO(image_data))
-            if img.mode in ('RGBA', 'LA', 'P'):
-                img = img.convert('RGB')
             
             # Resize if too large to avoid Bedrock request size limits
             w, h = img.size
             if w > max_dimension or h > max_dimension:
                 ratio = min(max_dimension / w, max_dimension / h)
                 new_size = (int(w * ratio), int(h * ratio))
+                # JPEG shrink-on-load: decode at a reduced DCT scale that still
+                # covers new_size instead of decoding full resolution (no-op for PNG)
+                img.draft('RGB', new_size)
+                if img.mode in ('RGBA', 'LA', 'P'):
+                    img = img.convert('RGB')
                 img = img.resize(new_size, Image.Resampling.LANCZOS)
                 logger.info(f"Image resized from {w}x{h} to {new_size[0]}x{new_size[1]}")
+            elif img.mode in ('RGBA', 'LA', 'P'):
+                img = img.convert('RGB')
+            
+            def encode(quality: int) -> bytes:
+                output = io.BytesIO()
+                img.save(output, format='JPEG', quality=quality, optimize=True,
+                         progressive=True, subsampling=2)
+                return output.getvalue()
             
+            # Step quality down from 85 until the image fits; most oversized
+            # images fit within one or two steps
+            max_bytes = max_size_kb * 1024
             quality = 85
-            output = io.BytesIO()
-            while quality > 20:
-                output.seek(0)
-                output.truncate()
-                img.save(output, format='JPEG', quality=quality, optimize=True)
-                size_kb = len(output.getvalue()) / 1024
-                if size_kb <= max_size_kb:
-                    break
+            compressed_data = encode(quality)
+            while len(compressed_data) > max_bytes and quality > 25:
                 quality -= 10
+                compressed_data = encode(quality)
             
-            compressed_data = output.getvalue()
             logger.info(f"Image compressed from {len(image_data)/1024:.1f}KB to {len(compressed_data)/1024:.1f}KB")
             return compressed_data
         except Exception as e:
@@ -156,7 +190,8 @@ class DiseaseIdentificationTools:
                           image_data: bytes,
                           user_id: str,
                           crop_type: Optional[str] = None,
-                          additional_context: Optional[str] = None) -> Dict[str, Any]:
+                          additional_context: Optional[str] = None,
+                          validation: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Analyze crop image for disease identification using Bedrock multimodal
         
@@ -165,13 +200,15 @@ class DiseaseIdentificationTools:
             user_id: User ID for tracking
             crop_type: Type of crop (optional)
             additional_context: Additional context from user
+            validation: Precomputed validate_image_quality result (optional)
         
         Returns:
             Dict with diagnosis results
         """
         try:
-            # Validate image quality
-            validation = self.validate_image_quality(image_data)
+            # Validate image quality (reuse caller's result if provided)
+            if validation is None:
+                validation = self.validate_image_quality(image_data)
             
             if not validation['valid']:
                 return {
@@ -312,17 +349,20 @@ class DiseaseIdentificationTools:
             # Store image in S3 (optional: analysis still works if bucket is missing)
             try:
                 s3_key = f"images/crop-photos/{user_id}/{diagnosis_id}.jpg"
-                self.s3_client.put_object(
-                    Bucket=self.s3_bucket,
-                    Key=s3_key,
-                    Body=compressed_image,
-                    ContentType='image/jpeg',
-                    Metadata={
-                        'user_id': user_id,
-                        'diagnosis_id': diagnosis_id,
-                        'crop_type': crop_type or 'unknown',
-                        'timestamp': str(int(datetime.now().timestamp()))
-                    }
+                self.s3_client.upload_fileobj(
+                    io.BytesIO(compressed_image),
+                    self.s3_bucket,
+                    s3_key,
+                    ExtraArgs={
+                        'ContentType': 'image/jpeg',
+                        'Metadata': {
+                            'user_id': user_id,
+                            'diagnosis_id': diagnosis_id,
+                            'crop_type': crop_type or 'unknown',
+                            'timestamp': str(int(datetime.now().timestamp()))
+                        }
+                    },
+                    Config=_TRANSFER_CONFIG
                 )
             except ClientError as e:
                 code = e.response.get('Error', {}).get('Code', '')
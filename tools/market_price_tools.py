@@ -12,9 +12,13 @@ from datetime import datetime, timedelta
 import requests
 import os
 from decimal import Decimal
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Shared generator for mock data; avoids the global random module's lock
+_rng = np.random.default_rng()
+
 
 class MarketPriceTools:
     """Market price tracking tools for RISE farming assistant"""
@@ -400,26 +404,24 @@ class MarketPriceTools:
     
     def _generate_mock_history(self, start_date: datetime, end_date: datetime) -> List[Dict[str, Any]]:
         """Generate mock historical data for demonstration"""
-        history = []
-        current_date = start_date
         base_price = 2400
         
-        while current_date <= end_date:
-            # Add some random variation
-            import random
-            variation = random.uniform(-100, 150)
-            price = base_price + variation
-            
-            history.append({
-                'date': current_date.isoformat(),
-                'price': round(price, 2),
-                'arrival_quantity': random.randint(80, 200)
-            })
-            
-            current_date += timedelta(days=1)
-            base_price = price  # Trend continuation
+        # Format every date up front instead of stepping a datetime per row
+        num_days = max((end_date - start_date).days + 1, 0)
+        dates = [(start_date + timedelta(days=i)).isoformat() for i in range(num_days)]
         
-        return history
+        # Random walk with trend continuation, drawn in one batch
+        prices = base_price + np.cumsum(_rng.uniform(-100, 150, num_days))
+        quantities = _rng.integers(80, 200, num_days, endpoint=True)
+        
+        return [
+            {
+                'date': date_str,
+                'price': round(float(price), 2),
+                'arrival_quantity': int(quantity)
+            }
+            for date_str, price, quantity in zip(dates, prices, quantities)
+        ]
     
     def _calculate_price_trends(self, prices: List[float]) -> Dict[str, Any]:
         """Calculate price trend statistics"""
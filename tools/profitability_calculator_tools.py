@@ -13,6 +13,12 @@ from decimal import Decimal
 
 logger = logging.getLogger(__name__)
 
+# Crop risk categories (module-level so lookups don't rebuild lists per call)
+_HIGH_PEST_RISK_CROPS = frozenset({'cotton', 'tomato', 'potato', 'rice', 'paddy'})
+_MEDIUM_PEST_RISK_CROPS = frozenset({'wheat', 'maize', 'onion', 'sugarcane'})
+_HIGH_VOLATILITY_CROPS = frozenset({'tomato', 'onion', 'potato', 'cotton'})
+_LOW_VOLATILITY_CROPS = frozenset({'wheat', 'rice', 'paddy', 'sugarcane'})
+
 
 class ProfitabilityCalculatorTools:
     """Crop profitability calculator with comprehensive cost and yield analysis"""
@@ -939,18 +945,14 @@ Keep the tone supportive and practical. Write in clear English."""
     def _assess_pest_disease_risk(self, crop_name: str, season: Optional[str]) -> Dict[str, Any]:
         """Assess pest and disease risks"""
         
-        # Crop-specific pest/disease risk database
-        high_risk_crops = ['cotton', 'tomato', 'potato', 'rice', 'paddy']
-        medium_risk_crops = ['wheat', 'maize', 'onion', 'sugarcane']
-        
-        if crop_name in high_risk_crops:
+        if crop_name in _HIGH_PEST_RISK_CROPS:
             return {
                 'score': 7,
                 'level': 'high',
                 'description': f'{crop_name.title()} is susceptible to pests and diseases',
                 'mitigation': 'Regular monitoring, integrated pest management, timely spraying'
             }
-        elif crop_name in medium_risk_crops:
+        elif crop_name in _MEDIUM_PEST_RISK_CROPS:
             return {
                 'score': 5,
                 'level': 'medium',
@@ -968,18 +970,14 @@ Keep the tone supportive and practical. Write in clear English."""
     def _assess_market_risk(self, crop_name: str) -> Dict[str, Any]:
         """Assess market price volatility risk"""
         
-        # Market volatility database
-        high_volatility_crops = ['tomato', 'onion', 'potato', 'cotton']
-        low_volatility_crops = ['wheat', 'rice', 'paddy', 'sugarcane']
-        
-        if crop_name in high_volatility_crops:
+        if crop_name in _HIGH_VOLATILITY_CROPS:
             return {
                 'score': 7,
                 'level': 'high',
                 'description': f'{crop_name.title()} prices are highly volatile',
                 'mitigation': 'Consider contract farming, storage options, or price hedging'
             }
-        elif crop_name in low_volatility_crops:
+        elif crop_name in _LOW_VOLATILITY_CROPS:
             return {
                 'score': 3,
                 'level': 'low',
@@ -5,55 +5,155 @@ Tools for speech-to-text, text-to-speech, and language detection using AWS servi
 
 import boto3
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import base64
+import hashlib
+import io
 import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
 import uuid
 
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+
 logger = logging.getLogger(__name__)
 
+# AWS clients shared across tool instances, keyed by (service, region); the
+# larger pool lets concurrent sessions reuse connections
+_CLIENT_CONFIG = Config(max_pool_connections=50, retries={'mode': 'adaptive'})
+_aws_clients: Dict[Tuple[str, str], Any] = {}
+# Client creation is serialized; boto3's default session is not safe for
+# concurrent client creation
+_aws_clients_lock = threading.Lock()
+
+# Multipart tuning for voice uploads; S3 parts must be at least 5MB, so
+# short clips go up in a single request and long ones in parallel parts
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=5 * 1024 * 1024,
+    multipart_chunksize=5 * 1024 * 1024,
+    max_concurrency=4,
+    use_threads=True
+)
+
+# Transcribe media formats and their content types. Browser recordings are
+# usually Opus in WebM (or MP4 on Safari) rather than WAV
+_AUDIO_CONTENT_TYPES = {
+    'wav': 'audio/wav',
+    'webm': 'audio/webm',
+    'ogg': 'audio/ogg',
+    'mp4': 'audio/mp4',
+    'mp3': 'audio/mpeg',
+    'flac': 'audio/flac'
+}
+
+
+def _detect_media_format(audio_data: bytes) -> str:
+    """Guess the Transcribe media format from the audio container's magic bytes"""
+    header = audio_data[:12]
+    if header.startswith(b'\x1a\x45\xdf\xa3'):
+        return 'webm'
+    if header.startswith(b'OggS'):
+        return 'ogg'
+    if header.startswith(b'fLaC'):
+        return 'flac'
+    if header[4:8] == b'ftyp':
+        return 'mp4'
+    if header.startswith(b'ID3') or header[:2] in (b'\xff\xfb', b'\xff\xf3', b'\xff\xf2'):
+        return 'mp3'
+    return 'wav'
+
+
+def _get_aws_client(service: str, region: str):
+    """Get shared AWS client for a service and region (created on first use)"""
+    with _aws_clients_lock:
+        client = _aws_clients.get((service, region))
+        if client is None:
+            client = boto3.client(service, region_name=region, config=_CLIENT_CONFIG)
+            _aws_clients[(service, region)] = client
+        return client
+
+
+def _clear_aws_clients():
+    """Drop the shared AWS clients so the next tool instance creates new ones"""
+    with _aws_clients_lock:
+        _aws_clients.clear()
+
+
+# Synthesized speech is cached by content hash: a small in-memory LRU shared
+# by all instances, backed by one file per utterance on disk. The disk cache
+# is pruned oldest-first (by mtime) after each write.
+TTS_CACHE_DIR = os.getenv('RISE_TTS_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'rise-tts-cache'))
+_TTS_DISK_CACHE_MAX_FILES = 1000
+_TTS_DISK_CACHE_MAX_BYTES = 100 * 1024 * 1024
+_TTS_MEMORY_CACHE_MAX = 128
+_TTS_MEMORY_CACHE_MAX_BYTES = 16 * 1024 * 1024
+_tts_memory_cache: "OrderedDict[str, bytes]" = OrderedDict()
+_tts_memory_bytes = 0
+_tts_memory_lock = threading.Lock()
+
+
+def _clear_tts_memory_cache():
+    """Drop all synthesized speech held in memory (the disk cache is kept)"""
+    global _tts_memory_bytes
+    with _tts_memory_lock:
+        _tts_memory_cache.clear()
+        _tts_memory_bytes = 0
+
+
+# Transcription job polling: check quickly at first, since short voice
+# queries usually finish within a few seconds, then back off
+_TRANSCRIBE_POLL_INITIAL = 0.5
+_TRANSCRIBE_POLL_MAX = 2.0
+_TRANSCRIBE_TIMEOUT = 60
+
 class VoiceProcessingTools:
     """Voice processing tools for RISE farming assistant"""
     
-    def __init__(self, region: str = "us-east-1"):
+    # Language code mapping for AWS services
+    language_codes = {
+        'en': {'transcribe': 'en-IN', 'polly': 'en-IN', 'name': 'English'},
+        'hi': {'transcribe': 'hi-IN', 'polly': 'hi-IN', 'name': 'Hindi'},
+        'ta': {'transcribe': 'ta-IN', 'polly': 'ta-IN', 'name': 'Tamil'},
+        'te': {'transcribe': 'te-IN', 'polly': 'te-IN', 'name': 'Telugu'},
+        'kn': {'transcribe': 'kn-IN', 'polly': 'kn-IN', 'name': 'Kannada'},
+        'bn': {'transcribe': 'bn-IN', 'polly': 'bn-IN', 'name': 'Bengali'},
+        'gu': {'transcribe': 'gu-IN', 'polly': 'gu-IN', 'name': 'Gujarati'},
+        'mr': {'transcribe': 'mr-IN', 'polly': 'mr-IN', 'name': 'Marathi'},
+        'pa': {'transcribe': 'pa-IN', 'polly': 'pa-IN', 'name': 'Punjabi'}
+    }
+    
+    # Polly voice mapping for Indic languages
+    polly_voices = {
+        'en-IN': 'Aditi',  # Female Indian English voice
+        'hi-IN': 'Aditi',  # Supports Hindi
+        'ta-IN': 'Aditi',  # Supports Tamil
+        'te-IN': 'Aditi',  # Supports Telugu
+        'kn-IN': 'Aditi',  # Supports Kannada
+        'bn-IN': 'Aditi',  # Supports Bengali
+        'gu-IN': 'Aditi',  # Supports Gujarati
+        'mr-IN': 'Aditi',  # Supports Marathi
+        'pa-IN': 'Aditi'   # Supports Punjabi
+    }
+    
+    def __init__(self, region: str = "us-east-1", tts_cache_dir: Optional[str] = None):
         """
         Initialize voice processing tools with AWS clients
         
         Args:
             region: AWS region for services
+            tts_cache_dir: Directory for cached speech audio (defaults to TTS_CACHE_DIR)
         """
         self.region = region
-        self.transcribe_client = boto3.client('transcribe', region_name=region)
-        self.polly_client = boto3.client('polly', region_name=region)
-        self.comprehend_client = boto3.client('comprehend', region_name=region)
-        self.s3_client = boto3.client('s3', region_name=region)
-        
-        # Language code mapping for AWS services
-        self.language_codes = {
-            'en': {'transcribe': 'en-IN', 'polly': 'en-IN', 'name': 'English'},
-            'hi': {'transcribe': 'hi-IN', 'polly': 'hi-IN', 'name': 'Hindi'},
-            'ta': {'transcribe': 'ta-IN', 'polly': 'ta-IN', 'name': 'Tamil'},
-            'te': {'transcribe': 'te-IN', 'polly': 'te-IN', 'name': 'Telugu'},
-            'kn': {'transcribe': 'kn-IN', 'polly': 'kn-IN', 'name': 'Kannada'},
-            'bn': {'transcribe': 'bn-IN', 'polly': 'bn-IN', 'name': 'Bengali'},
-            'gu': {'transcribe': 'gu-IN', 'polly': 'gu-IN', 'name': 'Gujarati'},
-            'mr': {'transcribe': 'mr-IN', 'polly': 'mr-IN', 'name': 'Marathi'},
-            'pa': {'transcribe': 'pa-IN', 'polly': 'pa-IN', 'name': 'Punjabi'}
-        }
-        
-        # Polly voice mapping for Indic languages
-        self.polly_voices = {
-            'en-IN': 'Aditi',  # Female Indian English voice
-            'hi-IN': 'Aditi',  # Supports Hindi
-            'ta-IN': 'Aditi',  # Supports Tamil
-            'te-IN': 'Aditi',  # Supports Telugu
-            'kn-IN': 'Aditi',  # Supports Kannada
-            'bn-IN': 'Aditi',  # Supports Bengali
-            'gu-IN': 'Aditi',  # Supports Gujarati
-            'mr-IN': 'Aditi',  # Supports Marathi
-            'pa-IN': 'Aditi'   # Supports Punjabi
-        }
+        self.tts_cache_dir = tts_cache_dir or TTS_CACHE_DIR
+        self.transcribe_client = _get_aws_client('transcribe', region)
+        self.polly_client = _get_aws_client('polly', region)
+        self.comprehend_client = _get_aws_client('comprehend', region)
+        self.s3_client = _get_aws_client('s3', region)
         
         logger.info(f"Voice processing tools initialized in region {region}")
     
@@ -116,15 +216,17 @@ class VoiceProcessingTools:
                         audio_data: bytes, 
                         language_code: Optional[str] = None,
                         s3_bucket: str = 'rise-application-data',
-                        enable_noise_reduction: bool = True) -> Dict[str, Any]:
+                        enable_noise_reduction: bool = True,
+                        media_format: Optional[str] = None) -> Dict[str, Any]:
         """
         Transcribe audio to text using Amazon Transcribe
         
         Args:
-            audio_data: Audio file bytes (WAV, MP3, FLAC, etc.)
+            audio_data: Audio file bytes (WAV, WebM/Opus, MP3, FLAC, etc.)
             language_code: Language code (e.g., 'hi', 'en'). If None, will auto-detect
             s3_bucket: S3 bucket for temporary audio storage
             enable_noise_reduction: Enable noise reduction for rural environments
+            media_format: Transcribe media format (e.g., 'wav', 'webm'). If None, detected from the audio
         
         Returns:
             Dict with transcription text and metadata
@@ -133,13 +235,16 @@ class VoiceProcessingTools:
             # Generate unique job name
             job_name = f"transcribe_{uuid.uuid4().hex[:8]}_{int(datetime.now().timestamp())}"
             
+            media_format = media_format or _detect_media_format(audio_data)
+            
             # Upload audio to S3
-            s3_key = f"audio/voice-queries/{job_name}.wav"
-            self.s3_client.put_object(
-                Bucket=s3_bucket,
-                Key=s3_key,
-                Body=audio_data,
-                ContentType='audio/wav'
+            s3_key = f"audio/voice-queries/{job_name}.{media_format}"
+            self.s3_client.upload_fileobj(
+                io.BytesIO(audio_data),
+                s3_bucket,
+                s3_key,
+                ExtraArgs={'ContentType': _AUDIO_CONTENT_TYPES.get(media_format, f'audio/{media_format}')},
+                Config=_TRANSFER_CONFIG
             )
             
             audio_uri = f"s3://{s3_bucket}/{s3_key}"
@@ -157,7 +262,7 @@ class VoiceProcessingTools:
             transcribe_params = {
                 'TranscriptionJobName': job_name,
                 'Media': {'MediaFileUri': audio_uri},
-                'MediaFormat': 'wav',
+                'MediaFormat': media_format,
                 'OutputBucketName': s3_bucket
             }
             
@@ -182,11 +287,10 @@ class VoiceProcessingTools:
             self.transcribe_client.start_transcription_job(**transcribe_params)
             
             # Wait for job completion (with timeout)
-            import time
-            max_wait = 60  # 60 seconds timeout
             wait_time = 0
+            poll_interval = _TRANSCRIBE_POLL_INITIAL
             
-            while wait_time < max_wait:
+            while wait_time < _TRANSCRIBE_TIMEOUT:
                 status = self.transcribe_client.get_transcription_job(
                     TranscriptionJobName=job_name
                 )
@@ -199,7 +303,7 @@ class VoiceProcessingTools:
                     
                     # Download transcript from S3
                     import requests
-                    transcript_response = requests.get(transcript_uri)
+                    transcript_response = requests.get(transcript_uri, timeout=10)
                     transcript_data = transcript_response.json()
                     
                     # Extract text
@@ -236,8 +340,9 @@ class VoiceProcessingTools:
                     }
                 
                 # Wait before checking again
-                time.sleep(2)
-                wait_time += 2
+                time.sleep(poll_interval)
+                wait_time += poll_interval
+                poll_interval = min(poll_interval * 2, _TRANSCRIBE_POLL_MAX)
             
             # Timeout
             logger.error(f"Transcription job timed out: {job_name}")
@@ -273,6 +378,104 @@ class VoiceProcessingTools:
         except Exception as e:
             logger.warning(f"Cleanup error: {e}")
     
+    def _get_speech_cache_key(self, text: str, polly_lang: str, voice_id: str, output_format: str) -> str:
+        """Generate content-hash cache key for synthesized speech"""
+        content = f"{text}|{polly_lang}|{voice_id}|{output_format}"
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+    
+    def _remember_speech(self, cache_key: str, audio_data: bytes):
+        """Keep audio in the in-memory LRU, evicting the least recently used"""
+        global _tts_memory_bytes
+        with _tts_memory_lock:
+            previous = _tts_memory_cache.pop(cache_key, None)
+            if previous is not None:
+                _tts_memory_bytes -= len(previous)
+            _tts_memory_cache[cache_key] = audio_data
+            _tts_memory_bytes += len(audio_data)
+            while (len(_tts_memory_cache) > _TTS_MEMORY_CACHE_MAX or
+                   _tts_memory_bytes > _TTS_MEMORY_CACHE_MAX_BYTES):
+                evicted_key, evicted = _tts_memory_cache.popitem(last=False)
+                _tts_memory_bytes -= len(evicted)
+                logger.debug(f"Evicted synthesized speech {evicted_key} from memory cache")
+    
+    def _get_cached_speech(self, cache_key: str, output_format: str) -> Optional[bytes]:
+        """Retrieve synthesized audio from memory, then disk"""
+        with _tts_memory_lock:
+            audio_data = _tts_memory_cache.get(cache_key)
+            if audio_data is not None:
+                _tts_memory_cache.move_to_end(cache_key)
+                return audio_data
+        
+        cache_path = os.path.join(self.tts_cache_dir, f"{cache_key}.{output_format}")
+        try:
+            with open(cache_path, 'rb') as f:
+                audio_data = f.read()
+        except OSError:
+            return None
+        
+        # Refresh the mtime so disk pruning keeps recently used audio
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+        
+        self._remember_speech(cache_key, audio_data)
+        return audio_data
+    
+    def _save_speech_to_cache(self, cache_key: str, output_format: str, audio_data: bytes):
+        """Save synthesized audio to memory and disk"""
+        self._remember_speech(cache_key, audio_data)
+        
+        cache_path = os.path.join(self.tts_cache_dir, f"{cache_key}.{output_format}")
+        try:
+            os.makedirs(self.tts_cache_dir, exist_ok=True)
+            # Write then rename so readers never see a partial file
+            tmp_path = f"{cache_path}.{uuid.uuid4().hex[:8]}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(audio_data)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write speech cache file: {e}")
+            return
+        
+        self._prune_speech_cache()
+    
+    def _prune_speech_cache(self):
+        """Delete the oldest cached speech files past the disk cache limits"""
+        entries = []
+        try:
+            with os.scandir(self.tts_cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith('.tmp'):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError as e:
+            logger.warning(f"Could not scan speech cache directory: {e}")
+            return
+        
+        total_bytes = sum(size for _, size, _ in entries)
+        count = len(entries)
+        if count <= _TTS_DISK_CACHE_MAX_FILES and total_bytes <= _TTS_DISK_CACHE_MAX_BYTES:
+            return
+        
+        entries.sort()
+        for _, size, path in entries:
+            if count <= _TTS_DISK_CACHE_MAX_FILES and total_bytes <= _TTS_DISK_CACHE_MAX_BYTES:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Could not evict speech cache file: {e}")
+                continue
+            count -= 1
+            total_bytes -= size
+    
     def synthesize_speech(self, 
                          text: str, 
                          language_code: str = 'en',
@@ -301,17 +504,24 @@ class VoiceProcessingTools:
             if not voice_id:
                 voice_id = self.polly_voices.get(polly_lang, 'Aditi')
             
-            # Synthesize speech
-            response = self.polly_client.synthesize_speech(
-                Text=text,
-                OutputFormat=output_format,
-                VoiceId=voice_id,
-                LanguageCode=polly_lang,
-                Engine='neural'  # Use neural engine for better quality
-            )
+            # Identical utterances are served from cache instead of Polly
+            cache_key = self._get_speech_cache_key(text, polly_lang, voice_id, output_format)
+            audio_data = self._get_cached_speech(cache_key, output_format)
+            cached = audio_data is not None
             
-            # Read audio stream
-            audio_data = response['AudioStream'].read()
+            if not cached:
+                # Synthesize speech
+                response = self.polly_client.synthesize_speech(
+                    Text=text,
+                    OutputFormat=output_format,
+                    VoiceId=voice_id,
+                    LanguageCode=polly_lang,
+                    Engine='neural'  # Use neural engine for better quality
+                )
+                
+                # Read audio stream
+                audio_data = response['AudioStream'].read()
+                self._save_speech_to_cache(cache_key, output_format, audio_data)
             
             # Encode to base64 for transmission
             audio_base64 = base64.b64encode(audio_data).decode('utf-8')
@@ -322,7 +532,8 @@ class VoiceProcessingTools:
                 'audio_format': output_format,
                 'language_code': language_code,
                 'voice_id': voice_id,
-                'text_length': len(text)
+                'text_length': len(text),
+                'cached': cached
             }
         
         except Exception as e:
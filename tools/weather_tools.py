@@ -5,16 +5,22 @@ Uses Open-Meteo free API (no API key required): https://open-meteo.com/
 """
 
 import boto3
+import copy
 import logging
 import json
 import hashlib
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timedelta, timezone
 import requests
 import os
 
 logger = logging.getLogger(__name__)
 
+# In-process forecast memo in front of the DynamoDB cache: cache_key -> (hour bucket, data).
+# Forecasts don't change within the hour, so repeated tool calls skip the DynamoDB round trip.
+_FORECAST_MEMO: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+_FORECAST_MEMO_MAX = 512
+
 # Open-Meteo uses WMO weather codes; map to short descriptions
 _WMO_WEATHER_CODES = {
     0: "Clear sky", 1: "Mainly clear", 2: "Partly cloudy", 3: "Overcast",
@@ -29,6 +35,27 @@ _WMO_WEATHER_CODES = {
 }
 
 
+# Same-day activity rules, checked in order:
+# (bucket, predicate(temp, humidity, wind, rain), activities)
+_TODAY_ACTIVITY_RULES = (
+    ('recommended_today',
+     lambda temp, humidity, wind, rain: rain == 0 and wind < 10 and 20 <= temp <= 30,
+     ("Spraying pesticides/fungicides", "Fertilizer application")),
+    ('recommended_today',
+     lambda temp, humidity, wind, rain: rain == 0 and temp < 30,
+     ("Field preparation and plowing", "Weeding operations")),
+    ('recommended_today',
+     lambda temp, humidity, wind, rain: rain > 0 or humidity > 70,
+     ("Transplanting seedlings",)),
+    ('avoid_today',
+     lambda temp, humidity, wind, rain: wind > 15 or rain > 0,
+     ("Spraying operations",)),
+    ('avoid_today',
+     lambda temp, humidity, wind, rain: temp > 35,
+     ("Heavy manual labor during midday",)),
+)
+
+
 def _weather_code_to_description(code: int) -> str:
     """Convert Open-Meteo WMO weather code to description."""
     return _WMO_WEATHER_CODES.get(int(code), "Unknown")
@@ -157,9 +184,15 @@ class WeatherTools:
         """
         try:
             cache_key = self._get_cache_key(latitude, longitude, f'forecast_{days}')
+            hour_bucket = datetime.now().strftime('%Y%m%d%H')
+            memo = _FORECAST_MEMO.get(cache_key)
+            if memo and memo[0] == hour_bucket:
+                return {'success': True, 'from_cache': True, **copy.deepcopy(memo[1])}
+            
             cached_data = self._get_from_cache(cache_key)
             if cached_data:
                 logger.info(f"Cache hit for forecast at ({latitude}, {longitude})")
+                self._remember_forecast(cache_key, hour_bucket, cached_data)
                 return {'success': True, 'from_cache': True, **cached_data}
             
             params = {
@@ -203,6 +236,7 @@ class WeatherTools:
                 'total_forecasts': len(daily_summary),
             }
             self._save_to_cache(cache_key, forecast_data)
+            self._remember_forecast(cache_key, hour_bucket, forecast_data)
             return {'success': True, 'from_cache': False, **forecast_data}
         
         except Exception as e:
@@ -440,22 +474,9 @@ class WeatherTools:
         wind = current['wind_speed']
         rain = current['rain_1h'] + current['rain_3h']
         
-        if rain == 0 and wind < 10 and 20 <= temp <= 30:
-            activities['recommended_today'].append("Spraying pesticides/fungicides")
-            activities['recommended_today'].append("Fertilizer application")
-        
-        if rain == 0 and temp < 30:
-            activities['recommended_today'].append("Field preparation and plowing")
-            activities['recommended_today'].append("Weeding operations")
-        
-        if rain > 0 or humidity > 70:
-            activities['recommended_today'].append("Transplanting seedlings")
-        
-        if wind > 15 or rain > 0:
-            activities['avoid_today'].append("Spraying operations")
-        
-        if temp > 35:
-            activities['avoid_today'].append("Heavy manual labor during midday")
+        for bucket, applies, names in _TODAY_ACTIVITY_RULES:
+            if applies(temp, humidity, wind, rain):
+                activities[bucket].extend(names)
         
         # Tomorrow's planning
         if len(forecast) > 0:
@@ -588,8 +609,15 @@ Keep the tone helpful and practical. Write in clear English. Do not use bullet p
         except Exception as e:
             logger.warning(f"Cache save error: {e}")
     
+    def _remember_forecast(self, cache_key: str, hour_bucket: str, forecast_data: Dict[str, Any]):
+        """Keep a private copy of a forecast in the in-process memo"""
+        if len(_FORECAST_MEMO) >= _FORECAST_MEMO_MAX:
+            _FORECAST_MEMO.clear()
+        _FORECAST_MEMO[cache_key] = (hour_bucket, copy.deepcopy(forecast_data))
+    
     def clear_cache(self):
         """Clear all cached weather data"""
+        _FORECAST_MEMO.clear()
         try:
             # Scan and delete all items
             response = self.weather_table.scan()
@@ -58,11 +58,12 @@ class AnalyticsDashboard:
             
             refresh_button = st.button("🔄 Refresh Data", use_container_width=True)
             
-            st.markdown("---")
-            st.markdown("### 📋 Quick Links")
-            st.markdown("- [CloudWatch Console](https://console.aws.amazon.com/cloudwatch)")
-            st.markdown("- [Lambda Functions](https://console.aws.amazon.com/lambda)")
-            st.markdown("- [DynamoDB Tables](https://console.aws.amazon.com/dynamodb)")
+            st.markdown(
+                "---\n### 📋 Quick Links\n"
+                "- [CloudWatch Console](https://console.aws.amazon.com/cloudwatch)\n"
+                "- [Lambda Functions](https://console.aws.amazon.com/lambda)\n"
+                "- [DynamoDB Tables](https://console.aws.amazon.com/dynamodb)"
+            )
         
         # Fetch analytics data
         with st.spinner("Loading analytics data..."):
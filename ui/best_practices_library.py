@@ -625,8 +625,7 @@ def render_my_contributions(best_practice_tools, user_id: str, user_language: st
     
     # Most popular practice
     if contributions.get('most_popular_practice'):
-        st.markdown("---")
-        st.markdown("### 🌟 Your Most Popular Practice")
+        st.markdown("---\n### 🌟 Your Most Popular Practice")
         
         most_popular = contributions['most_popular_practice']
         
@@ -640,8 +639,7 @@ def render_my_contributions(best_practice_tools, user_id: str, user_language: st
     
     # List of practices
     if practices:
-        st.markdown("---")
-        st.markdown("### Your Shared Practices")
+        st.markdown("---\n### Your Shared Practices")
         
         for practice in practices:
             with st.container():
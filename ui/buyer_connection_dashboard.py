@@ -157,8 +157,6 @@ def render_crop_listing_form(buyer_tools):
                 st.info(f"Found {result['potential_matches']} potential buyers")
                 
                 # Store listing in session state
-                if 'current_listing' not in st.session_state:
-                    st.session_state.current_listing = {}
                 st.session_state.current_listing = result
                 
                 # Show top matches
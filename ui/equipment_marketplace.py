@@ -298,9 +298,7 @@ def show_equipment_details(equipment_tools, equipment):
                     st.write(f"{i}. {step}")
                 
                 # Store booking in session state
-                if 'my_bookings' not in st.session_state:
-                    st.session_state.my_bookings = []
-                st.session_state.my_bookings.append(result)
+                st.session_state.setdefault('my_bookings', []).append(result)
             else:
                 st.error(f"Booking failed: {result.get('error')}")
 
@@ -110,11 +110,18 @@ def render_posts_feed(forum_tools, user_id: str, user_language: str, translation
         st.error(f"❌ Failed to load posts: {result.get('error')}")
 
 
+@st.fragment
 def render_post_card(forum_tools, post: Dict[str, Any], user_id: str, user_language: str, translation_enabled: bool, key_prefix: Optional[str] = None):
-    """Render a single post card. key_prefix ensures unique Streamlit keys when the same post appears in multiple sections."""
+    """Render a single post card. key_prefix ensures unique Streamlit keys when the same post appears in multiple sections.
+    
+    Each card is a fragment, so opening or cancelling a reply reruns only that card.
+    """
     pid = post.get('post_id', '')
     k = key_prefix if key_prefix is not None else pid
     
+    # Posts with an open reply form, shared by every card
+    replying_to = st.session_state.setdefault('forum_replying_to', set())
+    
     # Translate if needed
     display_post = post
     if translation_enabled and post['original_language'] != user_language:
@@ -208,10 +215,10 @@ def render_post_card(forum_tools, post: Dict[str, Any], user_id: str, user_langu
         
         with col6:
             if st.button("💬 Reply", key=f"reply_{k}"):
-                st.session_state[f'replying_to_{post["post_id"]}'] = True
+                replying_to.add(post['post_id'])
         
         # Reply form
-        if st.session_state.get(f'replying_to_{post["post_id"]}', False):
+        if post['post_id'] in replying_to:
             with st.form(key=f"reply_form_{k}"):
                 reply_content = st.text_area(
                     "Your Reply",
@@ -237,15 +244,15 @@ def render_post_card(forum_tools, post: Dict[str, Any], user_id: str, user_langu
                     
                     if reply_result['success']:
                         st.success("✅ Reply posted!")
-                        st.session_state[f'replying_to_{post["post_id"]}'] = False
+                        replying_to.discard(post['post_id'])
                         time.sleep(1)
                         st.rerun()
                     else:
                         st.error(f"❌ {reply_result.get('error')}")
                 
                 if cancel_reply:
-                    st.session_state[f'replying_to_{post["post_id"]}'] = False
-                    st.rerun()
+                    replying_to.discard(post['post_id'])
+                    st.rerun(scope="fragment")
 
 
 def render_create_post(forum_tools, user_id: str, user_language: str):
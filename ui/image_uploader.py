@@ -4,9 +4,9 @@ Streamlit component for uploading and analyzing crop images
 """
 
 import streamlit as st
-import base64
-from PIL import Image
+import hashlib
 import io
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 import sys
@@ -15,7 +15,109 @@ import os
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from tools.disease_identification_tools import DiseaseIdentificationTools
+# Display icons shared by the diagnosis, history card and comparison views
+_SEVERITY_ICONS = {'low': '🟢', 'medium': '🟡', 'high': '🟠', 'critical': '🔴'}
+_STATUS_ICONS = {
+    'pending': '⏳',
+    'treatment_applied': '💊',
+    'improving': '📈',
+    'worsened': '📉',
+    'resolved': '✅'
+}
+_TYPE_ICONS = {'disease': '🦠', 'pest': '🐛'}
+_PROGRESS_ICONS = {
+    'improving': '🟢',
+    'stable': '🟡',
+    'worsening': '🔴',
+    'insufficient_data': '⚪'
+}
+_STATUS_ORDER = ("pending", "treatment_applied", "improving", "worsened", "resolved")
+_STATUS_INDEX = {status: i for i, status in enumerate(_STATUS_ORDER)}
+
+# Attributes read by the history cards, filters and progress comparison; full
+# analysis text and treatments are only loaded on demand by generate_report
+_HISTORY_FIELDS = [
+    'diagnosis_id', 'created_timestamp', 'crop_type', 'severity',
+    'confidence_score', 'diseases', 'pests', 'follow_up_status',
+    'follow_up_notes', 'image_s3_key'
+]
+
+# Vision model calls run here so a slow analysis doesn't block the script run
+_ANALYSIS_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='rise-analysis')
+
+
+@st.cache_resource
+def get_disease_tools():
+    from tools.disease_identification_tools import DiseaseIdentificationTools
+    return DiseaseIdentificationTools()
+
+
+@st.cache_resource
+def get_history_tools():
+    from tools.diagnosis_history_tools import DiagnosisHistoryTools
+    return DiagnosisHistoryTools()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_history(user_id: str, filters_key: tuple, _history_tools) -> List[Dict[str, Any]]:
+    """Diagnosis history for the history tab, reused across reruns for 30s"""
+    return _history_tools.get_diagnosis_history(
+        user_id=user_id,
+        limit=20,
+        filters=dict(filters_key) or None,
+        projection=_HISTORY_FIELDS
+    )
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_statistics(user_id: str, _history_tools) -> Dict[str, Any]:
+    """Diagnosis statistics for the history tab, reused across reruns for 30s"""
+    return _history_tools.get_statistics(user_id)
+
+
+def _clear_history_caches():
+    """Drop cached history after diagnoses are added or updated"""
+    _cached_history.clear()
+    _cached_statistics.clear()
+
+
+def _image_hash(image_bytes: bytes) -> str:
+    """Content hash used to key every per-image cache (not a security hash)"""
+    return hashlib.blake2b(image_bytes, digest_size=16).hexdigest()
+
+
+@st.cache_data(max_entries=32, ttl=600, show_spinner=False)
+def _load_upload(image_hash: str, _image_bytes: bytes, max_dim: int = 1024) -> Dict[str, Any]:
+    """
+    Open an upload once per distinct image for both its details and preview
+    
+    Keyed on image_hash; _image_bytes is excluded from Streamlit's argument
+    hashing so cache lookups don't rehash the whole upload. The cache is
+    shared by all sessions, so it is capped and entries expire.
+    
+    Large JPEGs are decoded with draft() (shrink-on-load), so phone-camera
+    photos are never fully decoded just to show a thumbnail. Small images
+    are previewed as uploaded.
+    
+    Returns:
+        Dict with width, height, format and preview (image bytes)
+    """
+    from PIL import Image
+    img = Image.open(io.BytesIO(_image_bytes))
+    width, height = img.size
+    upload = {'width': width, 'height': height, 'format': img.format, 'preview': _image_bytes}
+    
+    if max(width, height) > max_dim:
+        img.draft('RGB', (max_dim, max_dim))
+        img.thumbnail((max_dim, max_dim), Image.Resampling.BILINEAR)
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        
+        buffer = io.BytesIO()
+        img.save(buffer, format='JPEG', quality=80, optimize=True)
+        upload['preview'] = buffer.getvalue()
+    
+    return upload
 
 
 class ImageUploader:
@@ -31,7 +133,18 @@ class ImageUploader:
         """
         self.user_id = user_id
         self.language_code = language_code
-        self.disease_tools = DiseaseIdentificationTools()
+        self._disease_tools = None
+    
+    @property
+    def disease_tools(self):
+        """Disease identification tools, created on first use (history-only pages never need them)"""
+        if self._disease_tools is None:
+            self._disease_tools = get_disease_tools()
+        return self._disease_tools
+    
+    @disease_tools.setter
+    def disease_tools(self, tools):
+        self._disease_tools = tools
     
     def render(self) -> Optional[Dict[str, Any]]:
         """
@@ -87,26 +200,28 @@ class ImageUploader:
         """Process uploaded image"""
         
         try:
-            # Read image bytes
-            image_bytes = image_file.read()
+            # UploadedFile is an in-memory buffer: getvalue() hands back its bytes
+            # without a read() copy and regardless of the current stream position
+            image_bytes = image_file.getvalue()
+            image_hash = _image_hash(image_bytes)
+            
+            # Image details and preview come from a single cached open of the upload
+            upload = _load_upload(image_hash, image_bytes)
             
             # Display image preview
             col1, col2 = st.columns([1, 1])
             
             with col1:
-                st.image(image_bytes, caption="Uploaded Image", use_container_width=True)
+                st.image(upload['preview'], caption="Uploaded Image", use_container_width=True)
             
             with col2:
                 st.markdown("#### Image Details")
                 
-                # Get image info
-                img = Image.open(io.BytesIO(image_bytes))
-                width, height = img.size
                 file_size_kb = len(image_bytes) / 1024
                 
-                st.markdown(f"**Dimensions:** {width} x {height} pixels")
+                st.markdown(f"**Dimensions:** {upload['width']} x {upload['height']} pixels")
                 st.markdown(f"**File Size:** {file_size_kb:.1f} KB")
-                st.markdown(f"**Format:** {img.format}")
+                st.markdown(f"**Format:** {upload['format']}")
             
             # Additional context inputs
             st.markdown("---")
@@ -130,13 +245,31 @@ class ImageUploader:
                     key="symptoms_input"
                 )
             
+            # Reject unusable images up front instead of queueing an analysis for them
+            validation = self._get_image_validation(image_bytes, image_hash)
+            if not validation.get('valid', False):
+                self._display_quality_issues(validation)
+            
             # Analyze button
-            if st.button("🔍 Analyze Image", type="primary", use_container_width=True):
+            if st.button(
+                "🔍 Analyze Image",
+                type="primary",
+                use_container_width=True,
+                disabled=not validation.get('valid', False)
+            ):
                 return self._analyze_image(
                     image_bytes=image_bytes,
                     crop_type=crop_type if crop_type else None,
-                    additional_context=symptoms if symptoms else None
+                    additional_context=symptoms if symptoms else None,
+                    image_hash=image_hash
                 )
+            
+            # Keep polling an analysis started on an earlier run for this image
+            pending = st.session_state.get('_analysis_future')
+            if pending is not None:
+                if pending[0][0] == image_hash:
+                    return self._poll_analysis()
+                del st.session_state['_analysis_future']
         
         except Exception as e:
             st.error(f"Error processing image: {e}")
@@ -146,36 +279,120 @@ class ImageUploader:
     def _analyze_image(self,
                       image_bytes: bytes,
                       crop_type: Optional[str],
-                      additional_context: Optional[str]) -> Optional[Dict[str, Any]]:
+                      additional_context: Optional[str],
+                      image_hash: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Analyze image for disease identification"""
         
-        with st.spinner("🔬 Analyzing image... This may take 10-15 seconds..."):
-            try:
-                # Analyze with disease identification tools
-                result = self.disease_tools.analyze_crop_image(
+        try:
+            image_hash = image_hash or _image_hash(image_bytes)
+            
+            # Re-analyzing the same image with the same inputs reuses the
+            # earlier diagnosis instead of another vision model call
+            key = (image_hash, crop_type, additional_context)
+            cache = st.session_state.setdefault('_analysis_cache', {})
+            if key in cache:
+                return self._show_analysis_result(cache[key])
+            
+            # Validation touches session state, so it runs here rather than in the worker
+            validation = self._get_image_validation(image_bytes, image_hash)
+            if not validation.get('valid', False):
+                return self._show_analysis_result({
+                    'success': False,
+                    'error': 'poor_image_quality',
+                    'validation': validation
+                })
+            
+            pending = st.session_state.get('_analysis_future')
+            if pending is None or pending[0] != key:
+                future = _ANALYSIS_EXECUTOR.submit(
+                    self.disease_tools.analyze_crop_image,
                     image_data=image_bytes,
                     user_id=self.user_id,
                     crop_type=crop_type,
-                    additional_context=additional_context
+                    additional_context=additional_context,
+                    validation=validation
                 )
-                
-                if result['success']:
-                    self._display_diagnosis(result)
-                    return result
-                else:
-                    # Handle errors (avoids generic 400 / AxiosError by showing backend message)
-                    if result.get('error') == 'poor_image_quality':
-                        self._display_quality_issues(result.get('validation', {}))
-                    else:
-                        err = result.get('error', 'Unknown error')
-                        st.error(f"Analysis failed: {err}")
-                        st.caption("Try a smaller or clearer JPEG/PNG image if the error persists.")
-            
-            except Exception as e:
-                st.error(f"Error during analysis: {e}")
+                st.session_state['_analysis_future'] = (key, future)
+        
+        except Exception as e:
+            st.error(f"Error during analysis: {e}")
+            return None
+        
+        return self._poll_analysis()
+    
+    def _poll_analysis(self) -> Optional[Dict[str, Any]]:
+        """
+        Collect the background analysis result
+        
+        While the analysis is still running the script is rerun every half
+        second, so the rest of the page keeps rendering in the meantime.
+        
+        Returns:
+            Diagnosis results once available and successful, None otherwise
+        """
+        key, future = st.session_state['_analysis_future']
+        
+        with st.spinner("🔬 Analyzing image... This may take 10-15 seconds..."):
+            done, _ = wait([future], timeout=0.5)
+        
+        if not done:
+            st.rerun()
+            return None
+        
+        del st.session_state['_analysis_future']
+        
+        try:
+            result = future.result()
+        except Exception as e:
+            st.error(f"Error during analysis: {e}")
+            return None
+        
+        # Only successful diagnoses are cached so failures can be retried
+        if result['success']:
+            st.session_state.setdefault('_analysis_cache', {})[key] = result
+            _clear_history_caches()
+        
+        return self._show_analysis_result(result)
+    
+    def _show_analysis_result(self, result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Display a diagnosis or the reason it failed"""
+        
+        if result['success']:
+            self._display_diagnosis(result)
+            return result
+        
+        # Handle errors (avoids generic 400 / AxiosError by showing backend message)
+        if result.get('error') == 'poor_image_quality':
+            self._display_quality_issues(result.get('validation', {}))
+        else:
+            err = result.get('error', 'Unknown error')
+            st.error(f"Analysis failed: {err}")
+            st.caption("Try a smaller or clearer JPEG/PNG image if the error persists.")
         
         return None
     
+    def _get_image_validation(self, image_bytes: bytes, image_hash: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Validate image quality once per upload
+        
+        Results are kept in session state keyed by a content hash, so
+        reruns with the same image skip decoding it again.
+        
+        Args:
+            image_bytes: Uploaded image bytes
+            image_hash: Precomputed content hash of image_bytes (optional)
+        
+        Returns:
+            Validation result from the disease identification tools
+        """
+        key = image_hash or _image_hash(image_bytes)
+        cache = st.session_state.setdefault('_img_quality_cache', {})
+        
+        if key not in cache:
+            cache[key] = self.disease_tools.validate_image_quality(image_bytes)
+        
+        return cache[key]
+    
     def _display_diagnosis(self, result: Dict[str, Any]):
         """Display diagnosis results"""
         
@@ -184,13 +401,7 @@ class ImageUploader:
         
         # Severity indicator
         severity = result.get('severity', 'unknown')
-        severity_colors = {
-            'low': '🟢',
-            'medium': '🟡',
-            'high': '🟠',
-            'critical': '🔴'
-        }
-        severity_icon = severity_colors.get(severity, '⚪')
+        severity_icon = _SEVERITY_ICONS.get(severity, '⚪')
         
         st.markdown(f"### {severity_icon} Severity: {severity.upper()}")
         
@@ -228,9 +439,10 @@ class ImageUploader:
         if treatments:
             with st.expander("💊 Treatment Recommendations", expanded=True):
                 for treatment in treatments:
-                    st.markdown(f"**{treatment.get('type', 'Treatment').title()}:**")
-                    st.markdown(treatment.get('description', ''))
-                    st.markdown("")
+                    st.markdown(
+                        f"**{treatment.get('type', 'Treatment').title()}:**\n\n"
+                        f"{treatment.get('description', '')}"
+                    )
         
         # Preventive measures
         prevention = result.get('preventive_measures', [])
@@ -248,8 +460,7 @@ class ImageUploader:
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            if st.button("📥 Download Report", use_container_width=True):
-                self._download_report(result)
+            self._download_report(result)
         
         with col2:
             if st.button("📤 Share with Expert", use_container_width=True):
@@ -280,10 +491,23 @@ class ImageUploader:
         st.info("Please upload a better quality image for accurate diagnosis.")
     
     def _download_report(self, result: Dict[str, Any]):
-        """Generate and download diagnosis report"""
+        """Render the diagnosis report download button"""
         
-        # Create text report
-        report = f"""
+        # The report text is only built when the button is actually clicked
+        st.download_button(
+            label="📥 Download Report",
+            data=lambda: self._build_report(result),
+            file_name=f"diagnosis_{result.get('diagnosis_id', 'report')}.txt",
+            mime="text/plain",
+            use_container_width=True
+        )
+    
+    def _build_report(self, result: Dict[str, Any]) -> str:
+        """Generate diagnosis report text"""
+        
+        diseases_block = "\n".join(f"- {d}" for d in result.get('diseases', ()))
+        
+        return f"""
 RISE - Crop Disease Diagnosis Report
 =====================================
 
@@ -295,7 +519,7 @@ SEVERITY: {result.get('severity', 'unknown').upper()}
 CONFIDENCE: {result.get('confidence_score', 0.0)*100:.1f}%
 
 DISEASES DETECTED:
-{chr(10).join(f"- {d}" for d in result.get('diseases', []))}
+{diseases_block}
 
 DETAILED ANALYSIS:
 {result.get('full_analysis', '')}
@@ -303,14 +527,6 @@ DETAILED ANALYSIS:
 ---
 Generated by RISE - Rural Innovation and Sustainable Ecosystem
 """
-        
-        # Create download button
-        st.download_button(
-            label="Download Report as Text",
-            data=report,
-            file_name=f"diagnosis_{result.get('diagnosis_id', 'report')}.txt",
-            mime="text/plain"
-        )
     
     def render_history(self):
         """Render enhanced diagnosis history with filtering and tracking"""
@@ -318,8 +534,7 @@ Generated by RISE - Rural Innovation and Sustainable Ecosystem
         st.markdown("### 📜 Diagnosis History & Treatment Tracking")
         
         try:
-            from tools.diagnosis_history_tools import DiagnosisHistoryTools
-            history_tools = DiagnosisHistoryTools()
+            history_tools = get_history_tools()
             
             # Filters section
             with st.expander("🔍 Filters & Options", expanded=False):
@@ -355,19 +570,21 @@ Generated by RISE - Rural Innovation and Sustainable Ecosystem
             if type_filter != "All":
                 filters['diagnosis_type'] = type_filter.lower()
             
-            # Get history with filters
-            history = history_tools.get_diagnosis_history(
-                user_id=self.user_id,
-                limit=20,
-                filters=filters if filters else None
-            )
+            # Get history with filters (cached briefly so card interactions don't requery)
+            history = _cached_history(self.user_id, tuple(sorted(filters.items())), history_tools)
             
             if not history:
                 st.info("No diagnoses found matching your filters. Try adjusting the filters or upload a new image!")
                 return
             
+            # Format every record's date once per run; cards and comparison options share them
+            date_strs = [
+                datetime.fromtimestamp(diag.get('created_timestamp', 0)).strftime('%Y-%m-%d %H:%M')
+                for diag in history
+            ]
+            
             # Statistics summary
-            stats = history_tools.get_statistics(self.user_id)
+            stats = _cached_statistics(self.user_id, history_tools)
             if stats.get('total_diagnoses', 0) > 0:
                 st.markdown("#### 📊 Your Diagnosis Summary")
                 
@@ -401,9 +618,8 @@ Generated by RISE - Rural Innovation and Sustainable Ecosystem
                     
                     # Create selection options
                     diagnosis_options = {}
-                    for diag in history:
-                        date_str = datetime.fromtimestamp(diag.get('created_timestamp', 0)).strftime('%Y-%m-%d')
-                        label = f"{date_str} - {diag.get('crop_type', 'Unknown')} ({diag.get('severity', 'unknown')})"
+                    for diag, date_str in zip(history, date_strs):
+                        label = f"{date_str[:10]} - {diag.get('crop_type', 'Unknown')} ({diag.get('severity', 'unknown')})"
                         diagnosis_options[label] = diag.get('diagnosis_id')
                     
                     selected_labels = st.multiselect(
@@ -413,50 +629,37 @@ Generated by RISE - Rural Innovation and Sustainable Ecosystem
                     )
                     
                     if len(selected_labels) >= 2:
-                        selected_ids = [diagnosis_options[label] for label in selected_labels]
+                        selected_ids = {diagnosis_options[label] for label in selected_labels}
                         
                         if st.button("📊 Generate Progress Report", use_container_width=True):
-                            self._display_comparison(history_tools, selected_ids)
+                            # The records are already loaded; no need to fetch them again by ID
+                            selected_records = [d for d in history if d.get('diagnosis_id') in selected_ids]
+                            self._display_comparison(history_tools, selected_records)
             
             st.markdown("---")
             st.markdown("#### 📋 Diagnosis Records")
             
             # Display history
-            for diagnosis in history:
-                self._render_diagnosis_card(diagnosis, history_tools)
+            for diagnosis, date_str in zip(history, date_strs):
+                self._render_diagnosis_card(diagnosis, history_tools, date_str)
         
         except Exception as e:
             st.error(f"Error loading history: {e}")
             import traceback
             st.error(traceback.format_exc())
     
-    def _render_diagnosis_card(self, diagnosis: Dict[str, Any], history_tools):
-        """Render individual diagnosis card with actions"""
-        
-        # Format date
-        date_str = datetime.fromtimestamp(diagnosis.get('created_timestamp', 0)).strftime('%Y-%m-%d %H:%M')
-        
-        # Severity icon
-        severity_icons = {
-            'low': '🟢',
-            'medium': '🟡',
-            'high': '🟠',
-            'critical': '🔴'
-        }
-        severity_icon = severity_icons.get(diagnosis.get('severity', 'low'), '⚪')
-        
-        # Status icon
-        status_icons = {
-            'pending': '⏳',
-            'treatment_applied': '💊',
-            'improving': '📈',
-            'worsened': '📉',
-            'resolved': '✅'
-        }
-        status_icon = status_icons.get(diagnosis.get('follow_up_status', 'pending'), '⏳')
-        
-        # Type icon
-        type_icon = '🦠' if diagnosis.get('diagnosis_type') == 'disease' else '🐛'
+    @st.fragment
+    def _render_diagnosis_card(self, diagnosis: Dict[str, Any], history_tools, date_str: str):
+        """
+        Render individual diagnosis card with actions
+        
+        Each card is a fragment, so clicking one card's buttons reruns only
+        that card instead of the whole history list.
+        """
+        
+        severity_icon = _SEVERITY_ICONS.get(diagnosis.get('severity', 'low'), '⚪')
+        status_icon = _STATUS_ICONS.get(diagnosis.get('follow_up_status', 'pending'), '⏳')
+        type_icon = _TYPE_ICONS.get(diagnosis.get('diagnosis_type'), _TYPE_ICONS['pest'])
         
         with st.expander(
             f"{type_icon} {date_str} - {diagnosis.get('crop_type', 'Unknown')} "
@@ -479,10 +682,8 @@ Generated by RISE - Rural Innovation and Sustainable Ecosystem
                 # Follow-up status update
                 new_status = st.selectbox(
                     "Update Status",
-                    ["pending", "treatment_applied", "improving", "worsened", "resolved"],
-                    index=["pending", "treatment_applied", "improving", "worsened", "resolved"].index(
-                        diagnosis.get('follow_up_status', 'pending')
-                    ),
+                    _STATUS_ORDER,
+                    index=_STATUS_INDEX.get(diagnosis.get('follow_up_status', 'pending'), 0),
                     key=f"status_{diagnosis.get('diagnosis_id')}"
                 )
                 
@@ -502,7 +703,9 @@ Generated by RISE - Rural Innovation and Sustainable Ecosystem
                     )
                     
                     if success:
+                        _clear_history_caches()
                         st.success("✅ Status updated!")
+                        # Full rerun: status changes affect the summary and filters above
                         st.rerun()
                     else:
                         st.error("❌ Update failed")
@@ -529,7 +732,12 @@ Generated by RISE - Rural Innovation and Sustainable Ecosystem
             
             with col2:
                 if st.button("📋 View Details", key=f"details_{diagnosis.get('diagnosis_id')}", use_container_width=True):
-                    st.json(diagnosis)
+                    # History rows are projected; load the full record on demand
+                    full_record = history_tools.get_diagnosis_by_id(
+                        diagnosis_id=diagnosis.get('diagnosis_id'),
+                        diagnosis_type=diagnosis.get('diagnosis_type', 'disease')
+                    )
+                    st.json(full_record or diagnosis)
             
             with col3:
                 if st.button("🖼️ View Image", key=f"image_{diagnosis.get('diagnosis_id')}", use_container_width=True):
@@ -548,10 +756,10 @@ Generated by RISE - Rural Innovation and Sustainable Ecosystem
                     else:
                         st.warning("⚠️ No image available for this diagnosis")
     
-    def _display_comparison(self, history_tools, diagnosis_ids: List[str]):
+    def _display_comparison(self, history_tools, diagnoses: List[Dict[str, Any]]):
         """Display diagnosis comparison for treatment progress"""
         
-        comparison = history_tools.compare_diagnoses(diagnosis_ids)
+        comparison = history_tools.compare_diagnosis_records(diagnoses)
         
         if not comparison.get('success'):
             st.error(f"Comparison failed: {comparison.get('error')}")
@@ -563,13 +771,7 @@ Generated by RISE - Rural Innovation and Sustainable Ecosystem
         
         # Progress status
         status = progress.get('status', 'unknown')
-        status_colors = {
-            'improving': '🟢',
-            'stable': '🟡',
-            'worsening': '🔴',
-            'insufficient_data': '⚪'
-        }
-        status_icon = status_colors.get(status, '⚪')
+        status_icon = _PROGRESS_ICONS.get(status, '⚪')
         
         st.markdown(f"## {status_icon} Status: {status.upper()}")
         
@@ -600,11 +802,12 @@ Generated by RISE - Rural Innovation and Sustainable Ecosystem
             st.markdown("### 📅 Treatment Timeline")
             
             diagnoses = comparison.get('diagnoses', [])
-            for i, diag in enumerate(diagnoses, 1):
-                date_str = datetime.fromtimestamp(diag.get('created_timestamp', 0)).strftime('%Y-%m-%d %H:%M')
-                
-                severity_icons = {'low': '🟢', 'medium': '🟡', 'high': '🟠', 'critical': '🔴'}
-                severity_icon = severity_icons.get(diag.get('severity', 'low'), '⚪')
+            date_strs = [
+                datetime.fromtimestamp(diag.get('created_timestamp', 0)).strftime('%Y-%m-%d %H:%M')
+                for diag in diagnoses
+            ]
+            for i, (diag, date_str) in enumerate(zip(diagnoses, date_strs), 1):
+                severity_icon = _SEVERITY_ICONS.get(diag.get('severity', 'low'), '⚪')
                 
                 st.markdown(
                     f"**{i}. {date_str}** {severity_icon} "
@@ -332,14 +332,13 @@ Say what this means in plain language and give 1-2 practical suggestions to bene
     
     # Export data option
     st.markdown("---")
-    if st.button("📥 Export Report as JSON"):
-        report_json = json.dumps(result, indent=2, default=str)
-        st.download_button(
-            label="Download JSON Report",
-            data=report_json,
-            file_name=f"economy_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-            mime="application/json"
-        )
+    # Serialized only when the download is clicked, not on every rerun
+    st.download_button(
+        label="📥 Export Report as JSON",
+        data=lambda: json.dumps(result, indent=2, default=str),
+        file_name=f"economy_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+        mime="application/json"
+    )
 
 
 def render_user_economy_tracker():
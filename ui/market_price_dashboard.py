@@ -11,6 +11,33 @@ from typing import Dict, Any, List, Optional
 import pandas as pd
 
 
+# Market data changes slowly, so it is reused across the reruns triggered by
+# every slider, selectbox and tab interaction on the dashboard
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_current_prices(crop_name: str, latitude: float, longitude: float,
+                           radius_km: int, _market_tools) -> Dict[str, Any]:
+    return _market_tools.get_current_prices(crop_name, latitude, longitude, radius_km)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_price_history(crop_name: str, market_id: str, days: int, _market_tools) -> Dict[str, Any]:
+    return _market_tools.get_price_history(crop_name, market_id, days)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_price_predictions(crop_name: str, market_id: str, forecast_days: int,
+                              _market_tools) -> Dict[str, Any]:
+    return _market_tools.predict_price_trends(crop_name, market_id, forecast_days)
+
+
+def _fetch_market_data(cached_fn, *args) -> Dict[str, Any]:
+    """Call a cached market data fetcher, dropping the entry again if it failed"""
+    result = cached_fn(*args)
+    if not result.get('success'):
+        cached_fn.clear(*args)
+    return result
+
+
 def render_market_price_dashboard(market_tools, user_location: Dict[str, float]):
     """
     Render market price dashboard in Streamlit
@@ -43,11 +70,13 @@ def render_market_price_dashboard(market_tools, user_location: Dict[str, float])
     if crop_name:
         # Fetch current prices
         with st.spinner("Fetching market prices..."):
-            result = market_tools.get_current_prices(
+            result = _fetch_market_data(
+                _cached_current_prices,
                 crop_name,
                 user_location['latitude'],
                 user_location['longitude'],
-                radius_km
+                radius_km,
+                market_tools
             )
         
         if result['success']:
@@ -228,7 +257,7 @@ def render_price_history(market_tools, crop_name: str, market_id: str):
     days = st.slider("Historical Period (days)", min_value=7, max_value=90, value=30, step=7)
     
     with st.spinner("Loading price history..."):
-        result = market_tools.get_price_history(crop_name, market_id, days)
+        result = _fetch_market_data(_cached_price_history, crop_name, market_id, days, market_tools)
     
     if result['success']:
         history = result['history']
@@ -318,7 +347,7 @@ def render_price_predictions(market_tools, crop_name: str, market_id: str):
     forecast_days = st.slider("Forecast Period (days)", min_value=3, max_value=14, value=7, step=1)
     
     with st.spinner("Generating price predictions..."):
-        result = market_tools.predict_price_trends(crop_name, market_id, forecast_days)
+        result = _fetch_market_data(_cached_price_predictions, crop_name, market_id, forecast_days, market_tools)
     
     if result['success']:
         predictions = result['predictions']
@@ -328,6 +357,7 @@ def render_price_predictions(market_tools, crop_name: str, market_id: str):
         # Predictions chart
         df = pd.DataFrame(predictions)
         df['date'] = pd.to_datetime(df['date'])
+        confidence = pd.DataFrame(df['confidence_range'].tolist(), index=df.index)
         
         fig = go.Figure()
         
@@ -344,8 +374,7 @@ def render_price_predictions(market_tools, crop_name: str, market_id: str):
         # Confidence range
         fig.add_trace(go.Scatter(
             x=df['date'].tolist() + df['date'].tolist()[::-1],
-            y=df['confidence_range'].apply(lambda x: x['high']).tolist() + 
-              df['confidence_range'].apply(lambda x: x['low']).tolist()[::-1],
+            y=confidence['high'].tolist() + confidence['low'].tolist()[::-1],
             fill='toself',
             fillcolor='rgba(155, 89, 182, 0.2)',
             line=dict(color='rgba(255,255,255,0)'),
@@ -366,15 +395,13 @@ def render_price_predictions(market_tools, crop_name: str, market_id: str):
         # Predictions table
         st.markdown("### 📅 Detailed Predictions")
         
-        pred_df = pd.DataFrame([
-            {
-                'Date': datetime.fromisoformat(p['date']).strftime('%Y-%m-%d'),
-                'Predicted Price': f"₹{p['predicted_price']:.2f}",
-                'Low Estimate': f"₹{p['confidence_range']['low']:.2f}",
-                'High Estimate': f"₹{p['confidence_range']['high']:.2f}"
-            }
-            for p in predictions
-        ])
+        rupees = "₹{:.2f}".format
+        pred_df = pd.DataFrame({
+            'Date': df['date'].dt.strftime('%Y-%m-%d'),
+            'Predicted Price': df['predicted_price'].map(rupees),
+            'Low Estimate': confidence['low'].map(rupees),
+            'High Estimate': confidence['high'].map(rupees)
+        })
         
         st.dataframe(pred_df, use_container_width=True, hide_index=True)
         
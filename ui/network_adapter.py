@@ -179,10 +179,7 @@ def render_network_indicator(language_code: str = 'en'):
     lang_messages = messages.get(language_code, messages['en'])
     
     # Try to get network info from session state
-    if 'network_type' not in st.session_state:
-        st.session_state.network_type = 'unknown'
-    
-    network_type = st.session_state.network_type
+    network_type = st.session_state.setdefault('network_type', 'unknown')
     message = lang_messages.get(network_type, lang_messages['unknown'])
     
     # Display indicator
@@ -222,16 +219,15 @@ def render_data_saver_toggle(language_code: str = 'en'):
     lang_labels = labels.get(language_code, labels['en'])
     
     # Initialize data saver state
-    if 'data_saver_enabled' not in st.session_state:
-        st.session_state.data_saver_enabled = False
+    data_saver_enabled = st.session_state.setdefault('data_saver_enabled', False)
     
     # Render toggle
     st.markdown(f"### {lang_labels['title']}")
     st.caption(lang_labels['description'])
     
     data_saver = st.toggle(
-        lang_labels['enabled'] if st.session_state.data_saver_enabled else lang_labels['disabled'],
-        value=st.session_state.data_saver_enabled,
+        lang_labels['enabled'] if data_saver_enabled else lang_labels['disabled'],
+        value=data_saver_enabled,
         key='data_saver_toggle'
     )
     
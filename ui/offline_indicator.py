@@ -5,20 +5,100 @@ Displays online/offline status and sync progress
 
 import json
 import streamlit as st
+from functools import lru_cache
 from typing import Optional
 
 
-def render_offline_indicator(language_code: str = "en") -> None:
-    """
-    Render offline/online status indicator with sync progress
+# Static widgets; their scripts poll the browser-side stores themselves
+_SYNC_STATUS_HTML = """
+    <div id="rise-sync-status-container"></div>
     
-    Args:
-        language_code: User's preferred language code
-    """
+    <script>
+    (function() {
+        async function updateSyncStatus() {
+            const container = document.getElementById('rise-sync-status-container');
+            
+            try {
+                if (window.countOfflineData) {
+                    const pending = await window.countOfflineData('offline_queue', 'sync_status', 'pending');
+                    const failed = await window.countOfflineData('offline_queue', 'sync_status', 'failed');
+                    
+                    const retryDelay = window.getSyncRetryDelay ? window.getSyncRetryDelay() : 0;
+                    const dropped = window.getDroppedActionCount ? window.getDroppedActionCount() : 0;
+                    
+                    if (pending > 0 || failed > 0) {
+                        container.innerHTML = `
+                            <div style="background: #FFF3E0; padding: 1rem; border-radius: 8px; margin: 1rem 0;">
+                                <strong>🔄 Sync Status:</strong><br>
+                                ${pending > 0 ? `⏳ ${pending} action(s) pending sync` : ''}
+                                ${failed > 0 ? `<br>❌ ${failed} action(s) failed` : ''}
+                                ${retryDelay > 0 ? `<br>🕐 Retrying in ${Math.ceil(retryDelay / 1000)}s` : ''}
+                                ${dropped > 0 ? `<br>⚠️ ${dropped} older action(s) dropped, queue full` : ''}
+                            </div>
+                        `;
+                    } else {
+                        container.innerHTML = `
+                            <div style="background: #E8F5E9; padding: 1rem; border-radius: 8px; margin: 1rem 0;">
+                                <strong>✅ All synced!</strong>
+                            </div>
+                        `;
+                    }
+                }
+            } catch (err) {
+                console.error('Error updating sync status:', err);
+            }
+        }
+        
+        // Update every 5 seconds
+        setInterval(updateSyncStatus, 5000);
+        updateSyncStatus();
+    })();
+    </script>
+"""
+
+_STORAGE_STATS_HTML = """
+    <div id="rise-storage-stats"></div>
+    
+    <script>
+    (function() {
+        async function updateStorageStats() {
+            const container = document.getElementById('rise-storage-stats');
+            
+            try {
+                if (window.getRiseStorageStats) {
+                    const stats = await window.getRiseStorageStats();
+                    
+                    container.innerHTML = `
+                        <div style="background: #F5F5F5; padding: 1rem; border-radius: 8px;">
+                            <strong>💾 Offline Storage</strong><br>
+                            <small>
+                                Storage Used: ${stats.indexeddb_used_mb} MB<br>
+                                Diagnoses: ${stats.diagnosis_count}<br>
+                                Cached Locations: ${stats.cached_weather_locations}<br>
+                                Pending Sync: ${stats.pending_sync_actions}
+                            </small>
+                        </div>
+                    `;
+                }
+            } catch (err) {
+                console.error('Error updating storage stats:', err);
+            }
+        }
+        
+        // Update every 10 seconds
+        setInterval(updateStorageStats, 10000);
+        updateStorageStats();
+    })();
+    </script>
+"""
+
+
+@lru_cache(maxsize=None)
+def _offline_indicator_html(language_code: str) -> str:
+    """Build the offline indicator HTML and JavaScript for a language"""
     from infrastructure.offline_config import OFFLINE_INDICATOR_CONFIG
     
-    # Generate the offline indicator HTML and JavaScript
-    indicator_html = f"""
+    return f"""
     <style>
     .rise-offline-banner {{
         position: fixed;
@@ -192,62 +272,75 @@ def render_offline_indicator(language_code: str = "en") -> None:
     }})();
     </script>
     """
-    
-    # Render the indicator
-    st.components.v1.html(indicator_html, height=0)
 
 
-def render_offline_features_info(language_code: str = "en") -> None:
+def render_offline_indicator(language_code: str = "en") -> None:
     """
-    Render information about offline features
+    Render offline/online status indicator with sync progress
     
     Args:
         language_code: User's preferred language code
     """
-    from infrastructure.offline_config import OFFLINE_FEATURES
-    
-    offline_info = {
-        "en": {
-            "title": "📱 Offline Features",
-            "description": "These features are available even without internet connection:",
-            "features": {
-                "diagnosis_history_view": "View past crop diagnoses",
-                "weather_view_cached": "View cached weather information",
-                "market_prices_view_cached": "View cached market prices",
-                "forum_read_only": "Read forum posts (read-only)",
-                "voice_input": "Record voice queries (will sync later)",
-                "chat_view_history": "View chat history",
-                "profile_view": "View your profile"
-            },
-            "note": "Actions taken offline will be automatically synced when connection is restored."
+    st.components.v1.html(_offline_indicator_html(language_code), height=0)
+
+
+_OFFLINE_INFO = {
+    "en": {
+        "title": "📱 Offline Features",
+        "description": "These features are available even without internet connection:",
+        "features": {
+            "diagnosis_history_view": "View past crop diagnoses",
+            "weather_view_cached": "View cached weather information",
+            "market_prices_view_cached": "View cached market prices",
+            "forum_read_only": "Read forum posts (read-only)",
+            "voice_input": "Record voice queries (will sync later)",
+            "chat_view_history": "View chat history",
+            "profile_view": "View your profile"
         },
-        "hi": {
-            "title": "📱 ऑफ़लाइन सुविधाएं",
-            "description": "ये सुविधाएं इंटरनेट कनेक्शन के बिना भी उपलब्ध हैं:",
-            "features": {
-                "diagnosis_history_view": "पिछले फसल निदान देखें",
-                "weather_view_cached": "कैश किया गया मौसम जानकारी देखें",
-                "market_prices_view_cached": "कैश किए गए बाजार मूल्य देखें",
-                "forum_read_only": "फोरम पोस्ट पढ़ें (केवल पढ़ने के लिए)",
-                "voice_input": "वॉयस प्रश्न रिकॉर्ड करें (बाद में सिंक होगा)",
-                "chat_view_history": "चैट इतिहास देखें",
-                "profile_view": "अपनी प्रोफ़ाइल देखें"
-            },
-            "note": "ऑफ़लाइन की गई कार्रवाइयां कनेक्शन बहाल होने पर स्वचालित रूप से सिंक हो जाएंगी।"
-        }
+        "note": "Actions taken offline will be automatically synced when connection is restored."
+    },
+    "hi": {
+        "title": "📱 ऑफ़लाइन सुविधाएं",
+        "description": "ये सुविधाएं इंटरनेट कनेक्शन के बिना भी उपलब्ध हैं:",
+        "features": {
+            "diagnosis_history_view": "पिछले फसल निदान देखें",
+            "weather_view_cached": "कैश किया गया मौसम जानकारी देखें",
+            "market_prices_view_cached": "कैश किए गए बाजार मूल्य देखें",
+            "forum_read_only": "फोरम पोस्ट पढ़ें (केवल पढ़ने के लिए)",
+            "voice_input": "वॉयस प्रश्न रिकॉर्ड करें (बाद में सिंक होगा)",
+            "chat_view_history": "चैट इतिहास देखें",
+            "profile_view": "अपनी प्रोफ़ाइल देखें"
+        },
+        "note": "ऑफ़लाइन की गई कार्रवाइयां कनेक्शन बहाल होने पर स्वचालित रूप से सिंक हो जाएंगी।"
     }
+}
+
+
+@lru_cache(maxsize=None)
+def _offline_features_markdown(language_code: str) -> str:
+    """Build the offline features list for a language as one markdown block"""
+    from infrastructure.offline_config import OFFLINE_FEATURES
     
-    info = offline_info.get(language_code, offline_info["en"])
+    info = _OFFLINE_INFO.get(language_code, _OFFLINE_INFO["en"])
+    features = [
+        f"✅ {feature_desc}"
+        for feature_key, feature_desc in info["features"].items()
+        if OFFLINE_FEATURES.get(feature_key, False)
+    ]
+    return "\n\n".join([f"**{info['description']}**", *features])
+
+
+def render_offline_features_info(language_code: str = "en") -> None:
+    """
+    Render information about offline features
+    
+    Args:
+        language_code: User's preferred language code
+    """
+    info = _OFFLINE_INFO.get(language_code, _OFFLINE_INFO["en"])
     
     with st.expander(info["title"]):
-        st.markdown(f"**{info['description']}**")
-        st.markdown("")
-        
-        for feature_key, feature_desc in info["features"].items():
-            if OFFLINE_FEATURES.get(feature_key, False):
-                st.markdown(f"✅ {feature_desc}")
-        
-        st.markdown("")
+        st.markdown(_offline_features_markdown(language_code))
         st.info(info["note"])
 
 
@@ -258,87 +351,11 @@ def render_sync_status(language_code: str = "en") -> None:
     Args:
         language_code: User's preferred language code
     """
-    sync_status_html = """
-    <div id="rise-sync-status-container"></div>
-    
-    <script>
-    (function() {
-        async function updateSyncStatus() {
-            const container = document.getElementById('rise-sync-status-container');
-            
-            try {
-                if (window.getAllOfflineData) {
-                    const pendingActions = await window.getAllOfflineData('offline_queue');
-                    const pending = pendingActions.filter(a => a.sync_status === 'pending');
-                    const failed = pendingActions.filter(a => a.sync_status === 'failed');
-                    
-                    if (pending.length > 0 || failed.length > 0) {
-                        container.innerHTML = `
-                            <div style="background: #FFF3E0; padding: 1rem; border-radius: 8px; margin: 1rem 0;">
-                                <strong>🔄 Sync Status:</strong><br>
-                                ${pending.length > 0 ? `⏳ ${pending.length} action(s) pending sync` : ''}
-                                ${failed.length > 0 ? `<br>❌ ${failed.length} action(s) failed` : ''}
-                            </div>
-                        `;
-                    } else {
-                        container.innerHTML = `
-                            <div style="background: #E8F5E9; padding: 1rem; border-radius: 8px; margin: 1rem 0;">
-                                <strong>✅ All synced!</strong>
-                            </div>
-                        `;
-                    }
-                }
-            } catch (err) {
-                console.error('Error updating sync status:', err);
-            }
-        }
-        
-        // Update every 5 seconds
-        setInterval(updateSyncStatus, 5000);
-        updateSyncStatus();
-    })();
-    </script>
-    """
     
-    st.components.v1.html(sync_status_html, height=100)
+    st.components.v1.html(_SYNC_STATUS_HTML, height=100)
 
 
 def render_storage_stats() -> None:
     """Render offline storage statistics"""
-    storage_stats_html = """
-    <div id="rise-storage-stats"></div>
-    
-    <script>
-    (function() {
-        async function updateStorageStats() {
-            const container = document.getElementById('rise-storage-stats');
-            
-            try {
-                if (window.getRiseStorageStats) {
-                    const stats = await window.getRiseStorageStats();
-                    
-                    container.innerHTML = `
-                        <div style="background: #F5F5F5; padding: 1rem; border-radius: 8px;">
-                            <strong>💾 Offline Storage</strong><br>
-                            <small>
-                                Storage Used: ${stats.indexeddb_used_mb} MB<br>
-                                Diagnoses: ${stats.diagnosis_count}<br>
-                                Cached Locations: ${stats.cached_weather_locations}<br>
-                                Pending Sync: ${stats.pending_sync_actions}
-                            </small>
-                        </div>
-                    `;
-                }
-            } catch (err) {
-                console.error('Error updating storage stats:', err);
-            }
-        }
-        
-        // Update every 10 seconds
-        setInterval(updateStorageStats, 10000);
-        updateStorageStats();
-    })();
-    </script>
-    """
     
-    st.components.v1.html(storage_stats_html, height=120)
+    st.components.v1.html(_STORAGE_STATS_HTML, height=120)
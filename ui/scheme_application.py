@@ -118,10 +118,7 @@ def render_application_wizard(tools: SchemeApplicationTools):
                 wizard_steps = result['wizard_steps']
                 
                 # Progress tracker
-                if 'current_step' not in st.session_state:
-                    st.session_state.current_step = 0
-                
-                current_step = st.session_state.current_step
+                current_step = st.session_state.setdefault('current_step', 0)
                 
                 # Progress bar
                 progress = (current_step + 1) / len(wizard_steps)
@@ -211,8 +211,13 @@ def render_scheme_recommendations(tools: SchemeDiscoveryTools):
                 st.error(f"❌ Error: {result.get('error', 'Recommendation failed')}")
 
 
+@st.fragment
 def render_scheme_card(scheme: dict, index: int):
-    """Render a scheme card"""
+    """Render a scheme card
+    
+    The card is a fragment, so its button reruns only the card and the
+    recommendation list around it stays on screen.
+    """
     # Priority color coding
     priority_colors = {
         'high': '🔴',
@@ -134,10 +134,9 @@ def render_find_suppliers_tab(tools):
                                 
                                 # Store supplier ID for later use
                                 if st.button(f"Select {supplier['business_name']}", key=f"select_{supplier['supplier_id']}"):
-                                    if 'selected_suppliers' not in st.session_state:
-                                        st.session_state.selected_suppliers = []
-                                    if supplier['supplier_id'] not in st.session_state.selected_suppliers:
-                                        st.session_state.selected_suppliers.append(supplier['supplier_id'])
+                                    selected_suppliers = st.session_state.setdefault('selected_suppliers', [])
+                                    if supplier['supplier_id'] not in selected_suppliers:
+                                        selected_suppliers.append(supplier['supplier_id'])
                                         st.success(f"Added {supplier['business_name']} to selection")
                     else:
                         st.info("No suppliers found matching your criteria")
@@ -6,13 +6,89 @@ Streamlit component for voice recording and playback
 import streamlit as st
 import streamlit.components.v1 as components
 import base64
+import hashlib
 import json
+import os
+import sys
 from typing import Optional, Dict, Any
 import logging
 
+# Add parent directory to path for imports
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.append(_PROJECT_ROOT)
+
 logger = logging.getLogger(__name__)
 
 
+@st.cache_resource
+def get_voice_tools():
+    # Imported on first use so loading the UI package doesn't pull in boto3
+    from tools.voice_tools import VoiceProcessingTools
+    return VoiceProcessingTools()
+
+
+def _audio_hash(audio_data: bytes) -> str:
+    """Content hash used to key per-recording caches (not a security hash)"""
+    return hashlib.blake2b(audio_data, digest_size=16).hexdigest()
+
+
+def _transcribe_recording(voice_tools, audio_data: bytes, language: str) -> Dict[str, Any]:
+    """
+    Transcribe a recording, reusing the result for the same audio and language
+    
+    Failed transcriptions are not cached so the user can retry them.
+    """
+    cache = st.session_state.setdefault('_transcription_cache', {})
+    cache_key = (_audio_hash(audio_data), language)
+    
+    if cache_key not in cache:
+        result = voice_tools.process_voice_query(
+            audio_data=audio_data,
+            user_language=language
+        )
+        if not result['success']:
+            return result
+        cache[cache_key] = result
+    
+    return cache[cache_key]
+
+
+# Recorder UI labels; max_duration is filled in per recorder
+_RECORDER_LABELS = {
+    'en': {
+        'start': 'Start Recording',
+        'stop': 'Stop Recording',
+        'recording': 'Recording...',
+        'processing': 'Processing...',
+        'play': 'Play',
+        'pause': 'Pause',
+        'duration': 'Duration',
+        'max_duration': 'Max {max_duration}s'
+    },
+    'hi': {
+        'start': 'रिकॉर्डिंग शुरू करें',
+        'stop': 'रिकॉर्डिंग बंद करें',
+        'recording': 'रिकॉर्ड हो रहा है...',
+        'processing': 'प्रोसेस हो रहा है...',
+        'play': 'चलाएं',
+        'pause': 'रोकें',
+        'duration': 'अवधि',
+        'max_duration': 'अधिकतम {max_duration}s'
+    }
+}
+
+# EBML header that starts every WebM recording
+_WEBM_MAGIC = b'\x1a\x45\xdf\xa3'
+
+# Recorder frontend (index.html + main.js) served as static files by Streamlit,
+# so reruns only send the labels and limits below as component args
+_recorder_component = components.declare_component(
+    "rise_voice_recorder",
+    path=os.path.join(os.path.dirname(os.path.abspath(__file__)), "voice_recorder_frontend")
+)
+
+
 def render_voice_recorder(
     key: str = "voice_recorder",
     language: str = "en",
@@ -32,324 +108,15 @@ def render_voice_recorder(
         Audio data as bytes if recording is complete, None otherwise
     """
     
-    # Language-specific labels
-    labels = {
-        'en': {
-            'start': 'Start Recording',
-            'stop': 'Stop Recording',
-            'recording': 'Recording...',
-            'processing': 'Processing...',
-            'play': 'Play',
-            'pause': 'Pause',
-            'duration': 'Duration',
-            'max_duration': f'Max {max_duration}s'
-        },
-        'hi': {
-            'start': 'रिकॉर्डिंग शुरू करें',
-            'stop': 'रिकॉर्डिंग बंद करें',
-            'recording': 'रिकॉर्ड हो रहा है...',
-            'processing': 'प्रोसेस हो रहा है...',
-            'play': 'चलाएं',
-            'pause': 'रोकें',
-            'duration': 'अवधि',
-            'max_duration': f'अधिकतम {max_duration}s'
-        }
-    }
-    
-    current_labels = labels.get(language, labels['en'])
-    
-    # HTML/JavaScript for voice recorder
-    recorder_html = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <style>
-            .voice-recorder {{
-                background: linear-gradient(135deg, #2E7D32 0%, #66BB6A 100%);
-                border-radius: 15px;
-                padding: 20px;
-                color: white;
-                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-            }}
-            
-            .recorder-controls {{
-                display: flex;
-                flex-direction: column;
-                align-items: center;
-                gap: 15px;
-            }}
-            
-            .record-button {{
-                width: 80px;
-                height: 80px;
-                border-radius: 50%;
-                border: none;
-                background: white;
-                color: #2E7D32;
-                font-size: 14px;
-                font-weight: bold;
-                cursor: pointer;
-                transition: all 0.3s;
-                box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-            }}
-            
-            .record-button:hover {{
-                transform: scale(1.05);
-                box-shadow: 0 6px 12px rgba(0,0,0,0.3);
-            }}
-            
-            .record-button.recording {{
-                background: #f44336;
-                color: white;
-                animation: pulse 1.5s infinite;
-            }}
-            
-            @keyframes pulse {{
-                0%, 100% {{ transform: scale(1); }}
-                50% {{ transform: scale(1.1); }}
-            }}
-            
-            .status-text {{
-                font-size: 16px;
-                font-weight: 500;
-                margin: 10px 0;
-            }}
-            
-            .duration-text {{
-                font-size: 14px;
-                opacity: 0.9;
-            }}
-            
-            .waveform {{
-                width: 100%;
-                height: 60px;
-                background: rgba(255,255,255,0.1);
-                border-radius: 10px;
-                margin: 10px 0;
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                overflow: hidden;
-            }}
-            
-            .waveform-bar {{
-                width: 3px;
-                background: white;
-                margin: 0 2px;
-                border-radius: 2px;
-                transition: height 0.1s;
-            }}
-            
-            .playback-controls {{
-                display: flex;
-                gap: 10px;
-                margin-top: 10px;
-            }}
-            
-            .play-button {{
-                padding: 10px 20px;
-                border: none;
-                border-radius: 8px;
-                background: white;
-                color: #2E7D32;
-                font-weight: 600;
-                cursor: pointer;
-                transition: all 0.3s;
-            }}
-            
-            .play-button:hover {{
-                background: #f0f0f0;
-            }}
-            
-            .error-message {{
-                background: #f44336;
-                color: white;
-                padding: 10px;
-                border-radius: 8px;
-                margin-top: 10px;
-            }}
-        </style>
-    </head>
-    <body>
-        <div class="voice-recorder">
-            <div class="recorder-controls">
-                <button id="recordButton" class="record-button">
-                    {current_labels['start']}
-                </button>
-                
-                <div class="status-text" id="statusText">
-                    {current_labels['max_duration']}
-                </div>
-                
-                <div class="duration-text" id="durationText">
-                    {current_labels['duration']}: 0s
-                </div>
-                
-                {'<div class="waveform" id="waveform"></div>' if show_waveform else ''}
-                
-                <div class="playback-controls" id="playbackControls" style="display: none;">
-                    <button class="play-button" id="playButton">
-                        {current_labels['play']}
-                    </button>
-                </div>
-                
-                <div class="error-message" id="errorMessage" style="display: none;"></div>
-            </div>
-        </div>
-        
-        <script>
-            let mediaRecorder;
-            let audioChunks = [];
-            let isRecording = false;
-            let recordingStartTime;
-            let durationInterval;
-            let audioBlob;
-            let audioUrl;
-            
-            const recordButton = document.getElementById('recordButton');
-            const statusText = document.getElementById('statusText');
-            const durationText = document.getElementById('durationText');
-            const playbackControls = document.getElementById('playbackControls');
-            const playButton = document.getElementById('playButton');
-            const errorMessage = document.getElementById('errorMessage');
-            const waveform = document.getElementById('waveform');
-            
-            const maxDuration = {max_duration};
-            
-            // Initialize waveform bars
-            if (waveform) {{
-                for (let i = 0; i < 30; i++) {{
-                    const bar = document.createElement('div');
-                    bar.className = 'waveform-bar';
-                    bar.style.height = '10px';
-                    waveform.appendChild(bar);
-                }}
-            }}
-            
-            recordButton.addEventListener('click', async () => {{
-                if (!isRecording) {{
-                    await startRecording();
-                }} else {{
-                    stopRecording();
-                }}
-            }});
-            
-            playButton.addEventListener('click', () => {{
-                if (audioUrl) {{
-                    const audio = new Audio(audioUrl);
-                    audio.play();
-                }}
-            }});
-            
-            async function startRecording() {{
-                try {{
-                    const stream = await navigator.mediaDevices.getUserMedia({{ audio: true }});
-                    
-                    mediaRecorder = new MediaRecorder(stream);
-                    audioChunks = [];
-                    
-                    mediaRecorder.ondataavailable = (event) => {{
-                        audioChunks.push(event.data);
-                    }};
-                    
-                    mediaRecorder.onstop = async () => {{
-                        audioBlob = new Blob(audioChunks, {{ type: 'audio/wav' }});
-                        audioUrl = URL.createObjectURL(audioBlob);
-                        
-                        // Convert to base64 and send to Streamlit
-                        const reader = new FileReader();
-                        reader.onloadend = () => {{
-                            const base64Audio = reader.result.split(',')[1];
-                            
-                            // Send to Streamlit
-                            window.parent.postMessage({{
-                                type: 'streamlit:setComponentValue',
-                                value: {{
-                                    audio_data: base64Audio,
-                                    duration: Math.floor((Date.now() - recordingStartTime) / 1000),
-                                    format: 'audio/wav'
-                                }}
-                            }}, '*');
-                        }};
-                        reader.readAsDataURL(audioBlob);
-                        
-                        // Show playback controls
-                        playbackControls.style.display = 'flex';
-                        statusText.textContent = '{current_labels['processing']}';
-                    }};
-                    
-                    mediaRecorder.start();
-                    isRecording = true;
-                    recordingStartTime = Date.now();
-                    
-                    recordButton.textContent = '{current_labels['stop']}';
-                    recordButton.classList.add('recording');
-                    statusText.textContent = '{current_labels['recording']}';
-                    
-                    // Update duration
-                    durationInterval = setInterval(() => {{
-                        const duration = Math.floor((Date.now() - recordingStartTime) / 1000);
-                        durationText.textContent = `{current_labels['duration']}: ${{duration}}s`;
-                        
-                        // Animate waveform
-                        if (waveform) {{
-                            const bars = waveform.querySelectorAll('.waveform-bar');
-                            bars.forEach(bar => {{
-                                const height = Math.random() * 50 + 10;
-                                bar.style.height = height + 'px';
-                            }});
-                        }}
-                        
-                        // Auto-stop at max duration
-                        if (duration >= maxDuration) {{
-                            stopRecording();
-                        }}
-                    }}, 100);
-                    
-                }} catch (error) {{
-                    showError('Microphone access denied. Please allow microphone access.');
-                    console.error('Error accessing microphone:', error);
-                }}
-            }}
-            
-            function stopRecording() {{
-                if (mediaRecorder && isRecording) {{
-                    mediaRecorder.stop();
-                    mediaRecorder.stream.getTracks().forEach(track => track.stop());
-                    
-                    isRecording = false;
-                    clearInterval(durationInterval);
-                    
-                    recordButton.textContent = '{current_labels['start']}';
-                    recordButton.classList.remove('recording');
-                    
-                    // Reset waveform
-                    if (waveform) {{
-                        const bars = waveform.querySelectorAll('.waveform-bar');
-                        bars.forEach(bar => {{
-                            bar.style.height = '10px';
-                        }});
-                    }}
-                }}
-            }}
-            
-            function showError(message) {{
-                errorMessage.textContent = message;
-                errorMessage.style.display = 'block';
-                setTimeout(() => {{
-                    errorMessage.style.display = 'none';
-                }}, 5000);
-            }}
-        </script>
-    </body>
-    </html>
-    """
+    current_labels = dict(_RECORDER_LABELS.get(language, _RECORDER_LABELS['en']))
+    current_labels['max_duration'] = current_labels['max_duration'].format(max_duration=max_duration)
     
-    # Render component (st.components.v1.html does not support key=)
-    component_value = components.html(
-        recorder_html,
-        height=300
+    component_value = _recorder_component(
+        labels=current_labels,
+        max_duration=max_duration,
+        show_waveform=show_waveform,
+        key=key,
+        default=None
     )
     
     # Process returned audio data
@@ -375,17 +142,11 @@ def render_audio_player(audio_data: bytes, key: str = "audio_player") -> None:
         key: Unique key for the component
     """
     
-    # Convert to base64 for embedding
-    audio_base64 = base64.b64encode(audio_data).decode('utf-8')
+    # Browser recordings are WebM/Opus; anything else is played as WAV
+    audio_format = "audio/webm" if audio_data[:4] == _WEBM_MAGIC else "audio/wav"
     
-    audio_html = f"""
-    <audio controls style="width: 100%; margin: 10px 0;">
-        <source src="data:audio/wav;base64,{audio_base64}" type="audio/wav">
-        Your browser does not support the audio element.
-    </audio>
-    """
-    
-    st.markdown(audio_html, unsafe_allow_html=True)
+    # Served from Streamlit's media endpoint rather than inlined as base64
+    st.audio(audio_data, format=audio_format)
 
 
 def create_voice_input_ui(
@@ -426,20 +187,10 @@ def create_voice_input_ui(
         if st.button("📝 Transcribe to Text", key=f"transcribe_{session_id}"):
             with st.spinner("Transcribing..."):
                 try:
-                    # Import voice tools
-                    import sys
-                    import os
-                    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-                    from tools.voice_tools import VoiceProcessingTools
-                    
-                    # Create voice tools instance
-                    voice_tools = VoiceProcessingTools()
+                    voice_tools = get_voice_tools()
                     
                     # Process voice query
-                    result = voice_tools.process_voice_query(
-                        audio_data=audio_data,
-                        user_language=language
-                    )
+                    result = _transcribe_recording(voice_tools, audio_data, language)
                     
                     if result['success']:
                         transcribed_text = result['text']
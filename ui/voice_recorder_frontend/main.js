@@ -0,0 +1,254 @@
+// RISE voice recorder component
+// Static frontend for render_voice_recorder: the browser caches this file and
+// each rerun only sends the labels and limits as component args.
+
+let mediaRecorder;
+let audioChunks = [];
+let isRecording = false;
+let recordingStartTime;
+let durationInterval;
+let audioBlob;
+let audioUrl;
+let audioContext;
+let analyser;
+let levelBuffer;
+let heardSpeech = false;
+let silentTicks = 0;
+
+let labels = {};
+let maxDuration = 60;
+
+const recordButton = document.getElementById('recordButton');
+const statusText = document.getElementById('statusText');
+const durationText = document.getElementById('durationText');
+const playbackControls = document.getElementById('playbackControls');
+const playButton = document.getElementById('playButton');
+const errorMessage = document.getElementById('errorMessage');
+const waveform = document.getElementById('waveform');
+
+// Messages to the Streamlit page hosting this component
+function sendToStreamlit(type, data) {
+    window.parent.postMessage(Object.assign({ isStreamlitMessage: true, type: type }, data), '*');
+}
+
+function updateFrameHeight() {
+    sendToStreamlit('streamlit:setFrameHeight', { height: document.body.scrollHeight });
+}
+
+// Waveform levels are generated once and scrolled through while recording
+const WAVEFORM_SAMPLES = 600;
+const waveformLevels = new Uint8Array(WAVEFORM_SAMPLES);
+crypto.getRandomValues(waveformLevels);
+const waveformBars = [];
+let waveformFrame;
+let waveformOffset = 0;
+let lastWaveformStep = 0;
+
+// Initialize waveform bars
+for (let i = 0; i < 30; i++) {
+    const bar = document.createElement('div');
+    bar.className = 'waveform-bar';
+    waveform.appendChild(bar);
+    waveformBars.push(bar);
+}
+
+function animateWaveform(timestamp) {
+    if (timestamp - lastWaveformStep >= 100) {
+        lastWaveformStep = timestamp;
+        waveformOffset = (waveformOffset + 1) % WAVEFORM_SAMPLES;
+        for (let j = 0; j < waveformBars.length; j++) {
+            const level = waveformLevels[(waveformOffset + j) % WAVEFORM_SAMPLES];
+            waveformBars[j].style.transform = 'scaleY(' + (level / 255 * 5 + 1) + ')';
+        }
+    }
+    waveformFrame = requestAnimationFrame(animateWaveform);
+}
+
+// Opus in WebM at 24 kbps is about a tenth the size of 16-bit PCM; browsers
+// without it fall back to their default recording format
+const OPUS_MIME_TYPE = 'audio/webm;codecs=opus';
+const recorderOptions = window.MediaRecorder && MediaRecorder.isTypeSupported(OPUS_MIME_TYPE)
+    ? { mimeType: OPUS_MIME_TYPE, audioBitsPerSecond: 24000 }
+    : {};
+
+// Recording stops once the speaker has been quiet for
+// SILENCE_TICKS duration ticks (100ms each) after talking
+const SILENCE_RMS = 0.02;
+const SILENCE_TICKS = 4;
+
+function isSilent() {
+    analyser.getByteTimeDomainData(levelBuffer);
+    let sum = 0;
+    for (let i = 0; i < levelBuffer.length; i++) {
+        const sample = (levelBuffer[i] - 128) / 128;
+        sum += sample * sample;
+    }
+    return Math.sqrt(sum / levelBuffer.length) < SILENCE_RMS;
+}
+
+// Args are re-sent on every rerun; only the labels and limits are applied so
+// a recording in progress is left alone
+function onRender(args) {
+    labels = args.labels;
+    maxDuration = args.max_duration;
+    waveform.style.display = args.show_waveform ? 'flex' : 'none';
+    playButton.textContent = labels.play;
+
+    if (!isRecording) {
+        recordButton.textContent = labels.start;
+        if (!audioBlob) {
+            statusText.textContent = labels.max_duration;
+            durationText.textContent = `${labels.duration}: 0s`;
+        }
+    }
+
+    updateFrameHeight();
+}
+
+window.addEventListener('message', (event) => {
+    if (event.data && event.data.type === 'streamlit:render') {
+        onRender(event.data.args);
+    }
+});
+
+recordButton.addEventListener('click', async () => {
+    if (!isRecording) {
+        await startRecording();
+    } else {
+        stopRecording();
+    }
+});
+
+playButton.addEventListener('click', () => {
+    if (audioUrl) {
+        const audio = new Audio(audioUrl);
+        audio.play();
+    }
+});
+
+async function startRecording() {
+    try {
+        const stream = await navigator.mediaDevices.getUserMedia({ audio: true });
+
+        mediaRecorder = new MediaRecorder(stream, recorderOptions);
+        audioChunks = [];
+
+        const AudioContextClass = window.AudioContext || window.webkitAudioContext;
+        if (AudioContextClass) {
+            audioContext = new AudioContextClass();
+            analyser = audioContext.createAnalyser();
+            analyser.fftSize = 512;
+            audioContext.createMediaStreamSource(stream).connect(analyser);
+            levelBuffer = new Uint8Array(analyser.fftSize);
+            heardSpeech = false;
+            silentTicks = 0;
+        }
+
+        mediaRecorder.ondataavailable = (event) => {
+            audioChunks.push(event.data);
+        };
+
+        mediaRecorder.onstop = async () => {
+            const mimeType = mediaRecorder.mimeType || 'audio/webm';
+            audioBlob = new Blob(audioChunks, { type: mimeType });
+            audioUrl = URL.createObjectURL(audioBlob);
+
+            // Convert to base64 and send to Streamlit
+            const reader = new FileReader();
+            reader.onloadend = () => {
+                const base64Audio = reader.result.split(',')[1];
+
+                sendToStreamlit('streamlit:setComponentValue', {
+                    dataType: 'json',
+                    value: {
+                        audio_data: base64Audio,
+                        duration: Math.floor((Date.now() - recordingStartTime) / 1000),
+                        format: mimeType.split(';')[0]
+                    }
+                });
+            };
+            reader.readAsDataURL(audioBlob);
+
+            // Show playback controls
+            playbackControls.style.display = 'flex';
+            statusText.textContent = labels.processing;
+            updateFrameHeight();
+        };
+
+        mediaRecorder.start();
+        isRecording = true;
+        recordingStartTime = Date.now();
+
+        recordButton.textContent = labels.stop;
+        recordButton.classList.add('recording');
+        statusText.textContent = labels.recording;
+
+        // Animate waveform
+        if (waveform.style.display !== 'none') {
+            waveformFrame = requestAnimationFrame(animateWaveform);
+        }
+
+        // Update duration
+        durationInterval = setInterval(() => {
+            const duration = Math.floor((Date.now() - recordingStartTime) / 1000);
+            durationText.textContent = `${labels.duration}: ${duration}s`;
+
+            // Auto-stop at max duration
+            if (duration >= maxDuration) {
+                stopRecording();
+                return;
+            }
+
+            // Auto-stop when the speaker has finished
+            if (analyser) {
+                if (!isSilent()) {
+                    heardSpeech = true;
+                    silentTicks = 0;
+                } else if (heardSpeech && ++silentTicks >= SILENCE_TICKS) {
+                    stopRecording();
+                }
+            }
+        }, 100);
+
+    } catch (error) {
+        showError('Microphone access denied. Please allow microphone access.');
+        console.error('Error accessing microphone:', error);
+    }
+}
+
+function stopRecording() {
+    if (mediaRecorder && isRecording) {
+        mediaRecorder.stop();
+        mediaRecorder.stream.getTracks().forEach(track => track.stop());
+
+        isRecording = false;
+        clearInterval(durationInterval);
+
+        if (audioContext) {
+            audioContext.close();
+            audioContext = null;
+            analyser = null;
+        }
+
+        recordButton.textContent = labels.start;
+        recordButton.classList.remove('recording');
+
+        // Reset waveform
+        cancelAnimationFrame(waveformFrame);
+        waveformBars.forEach(bar => {
+            bar.style.transform = '';
+        });
+    }
+}
+
+function showError(message) {
+    errorMessage.textContent = message;
+    errorMessage.style.display = 'block';
+    updateFrameHeight();
+    setTimeout(() => {
+        errorMessage.style.display = 'none';
+        updateFrameHeight();
+    }, 5000);
+}
+
+sendToStreamlit('streamlit:componentReady', { apiVersion: 1 });
@@ -6,11 +6,23 @@ Run this to verify Phase 1 setup is complete
 
 import sys
 import os
-from pathlib import Path
+import importlib
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 def check_mark(condition):
     return "✅" if condition else "❌"
 
+def _dir_entries(path, listings):
+    """Entries of a directory by name, read once per directory"""
+    if path not in listings:
+        try:
+            with os.scandir(path) as entries:
+                listings[path] = {entry.name: entry for entry in entries}
+        except OSError:
+            listings[path] = {}
+    return listings[path]
+
 def verify_setup():
     """Verify all Phase 1 setup requirements"""
     
@@ -20,6 +32,7 @@ def verify_setup():
     print()
     
     all_checks_passed = True
+    listings = {}
     
     # 1. Check Python version
     print("1. Python Version Check")
@@ -49,20 +62,31 @@ def verify_setup():
         'pytest': 'Testing Framework'
     }
     
+    # Import the packages concurrently, then report them in the listed order
+    with ThreadPoolExecutor(max_workers=len(required_packages)) as executor:
+        probes = {
+            package: executor.submit(importlib.import_module, package)
+            for package in required_packages
+        }
+    
     for package, name in required_packages.items():
         try:
-            __import__(package)
+            probes[package].result()
             print(f"   ✅ {name}")
         except ImportError:
             print(f"   ❌ {name} - Not installed")
             all_checks_passed = False
+        except Exception as e:
+            print(f"   ❌ {name} - Import error: {e}")
+            all_checks_passed = False
     print()
     
     # 4. Check project structure
     print("4. Project Structure Check")
     required_dirs = ['agents', 'tools', 'ui', 'data', 'tests']
     for dir_name in required_dirs:
-        exists = Path(dir_name).is_dir()
+        entry = _dir_entries('.', listings).get(dir_name)
+        exists = entry is not None and entry.is_dir()
         print(f"   {check_mark(exists)} {dir_name}/")
         if not exists:
             all_checks_passed = False
@@ -81,7 +105,9 @@ def verify_setup():
     ]
     
     for file_name in required_files:
-        exists = Path(file_name).is_file()
+        parent, name = os.path.split(file_name)
+        entry = _dir_entries(parent or '.', listings).get(name)
+        exists = entry is not None and entry.is_file()
         print(f"   {check_mark(exists)} {file_name}")
         if not exists:
             all_checks_passed = False
@@ -116,8 +142,12 @@ def verify_setup():
     # 8. Run tests
     print("8. Test Suite Check")
     try:
-        import pytest
-        result = pytest.main(['-v', 'tests/test_setup.py', '--tb=no', '-q'])
+        # Run in a separate interpreter so pytest plugins don't load into this one
+        result = subprocess.run(
+            [sys.executable, '-m', 'pytest', '-q', '--tb=no', '-p', 'no:cacheprovider', 'tests/test_setup.py'],
+            capture_output=True,
+            timeout=120
+        ).returncode
         if result == 0:
             print(f"   ✅ All tests passing")
         else: